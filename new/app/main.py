@@ -2,7 +2,6 @@
 Main entry point for the application.
 """
 import sys
-import logging
 import asyncio
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import QCoreApplication, QThread, QEventLoop
@@ -39,14 +38,7 @@ class AsyncioEventLoopThread(QThread):
 
 def main():
     """Main application entry point."""
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler()
-        ]
-    )
+    # Logging is configured by MainWindow
     
     # Set application information
     QCoreApplication.setApplicationName("CryptoPortfolioManager")
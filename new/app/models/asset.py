@@ -56,6 +56,9 @@ class Asset:
         self.is_short: bool = False
         self.leverage: float = 1.0
         self.unrealized_pnl: float = 0.0
+        # Cached display name and the position fields it was built from
+        self._display_key: Optional[tuple] = None
+        self._display_name: str = symbol
         
     @property
     def base_symbol(self) -> str:
@@ -68,18 +71,22 @@ class Asset:
         if self.is_long or self.is_short:
             # If symbol contains spaces, extract just the first part before any spaces
             # This assumes symbol format like "BTCUSDT LONG 10x"
-            if " " in self.symbol:
-                return self.symbol.split()[0]
+            return self.symbol.partition(" ")[0]
         
         return self.symbol
     
     @property
     def display_name(self) -> str:
         """Get a formatted display name for the asset including position details if applicable."""
-        if self.is_long or self.is_short:
-            position_type = "LONG" if self.is_long else "SHORT"
-            return f"{self.base_symbol} {position_type} {self.leverage}x"
-        return self.symbol
+        # Rebuilt only when the position fields change
+        key = (self.is_long, self.is_short, self.leverage)
+        if key != self._display_key:
+            self._display_key = key
+            if self.is_long or self.is_short:
+                self._display_name = f"{self.base_symbol} {self.position_type} {self.leverage}x"
+            else:
+                self._display_name = self.symbol
+        return self._display_name
         
     def update_price(self, price_data: AssetPrice):
         """Update the price data for this asset."""
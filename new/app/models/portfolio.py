@@ -3,6 +3,7 @@ Portfolio model for managing watchlists and asset collections.
 """
 from typing import Dict, List, Set, Optional
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -92,8 +93,8 @@ class Portfolio:
             'futures_positions': Watchlist('Futures Positions')
         }
         self.active_watchlist_name = 'default'
-        # Special flag for the futures positions watchlist
-        self.futures_positions_updated = datetime.now()
+        # Special flag for the futures positions watchlist (epoch seconds)
+        self.futures_positions_updated: float = time.time()
         
     @property
     def active_watchlist(self) -> Watchlist:
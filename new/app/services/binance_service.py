@@ -74,6 +74,9 @@ class BinanceService(QObject):
         '1w': '1w',
     }
     
+    # Spot REQUEST_WEIGHT limit per minute
+    REQUEST_WEIGHT_LIMIT = 6000
+    
     def __init__(self, settings: Settings):
         """Initialize the Binance service.
         
@@ -163,6 +166,26 @@ class BinanceService(QObject):
             self.async_client = None
             self.bsm = None
             
+    def get_quota_headroom(self) -> float:
+        """Get the unused share of the per-minute request weight.
+        
+        Based on the used-weight header of the last REST response.
+        
+        Returns:
+            float: Headroom between 0 (quota exhausted) and 1 (unused or unknown)
+        """
+        response = getattr(self.client, 'response', None)
+        if response is None:
+            return 1.0
+            
+        used = response.headers.get('x-mbx-used-weight-1m')
+        try:
+            used_weight = int(used)
+        except (TypeError, ValueError):
+            return 1.0
+            
+        return max(0.0, 1.0 - used_weight / self.REQUEST_WEIGHT_LIMIT)
+        
     def get_exchange_info(self) -> dict:
         """Get exchange information from Binance.
         
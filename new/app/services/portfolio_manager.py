@@ -1,13 +1,20 @@
 """
 Portfolio manager service for handling watchlists and assets.
 """
+import heapq
 import json
 import logging
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+import numpy as np
+from PyQt5.QtCore import (
+    QObject, QRunnable, QThreadPool, QMetaObject, Qt, Q_ARG,
+    pyqtSignal, pyqtSlot
+)
 
 from app.models.asset import Asset, AssetPrice, AssetType
 from app.models.portfolio import Portfolio, Watchlist
@@ -15,6 +22,60 @@ from app.services.binance_service import BinanceService
 from app.config.settings import Settings
 
 
+def asset_arrays(assets: List[Asset]) -> Tuple[np.ndarray, ...]:
+    """Extract the numeric fields of assets into parallel arrays.
+    
+    Args:
+        assets: Assets to extract
+        
+    Returns:
+        Tuple of (prices, changes, volumes, balances, values) arrays, with NaN
+        prices, changes and volumes for assets without price data
+    """
+    count = len(assets)
+    prices = np.fromiter(
+        (a.price_data.price if a.price_data else np.nan for a in assets),
+        dtype=np.float64, count=count
+    )
+    changes = np.fromiter(
+        (a.price_data.change_24h if a.price_data else np.nan for a in assets),
+        dtype=np.float64, count=count
+    )
+    volumes = np.fromiter(
+        (a.price_data.volume_24h if a.price_data else np.nan for a in assets),
+        dtype=np.float64, count=count
+    )
+    balances = np.fromiter((a.balance for a in assets), dtype=np.float64, count=count)
+    values = np.nan_to_num(balances * prices)
+    return prices, changes, volumes, balances, values
+
+
+class _FetchPriceRunnable(QRunnable):
+    """Thread pool task that fetches an asset price off the GUI thread."""
+    
+    def __init__(self, manager: 'PortfolioManager', symbol: str):
+        """Initialize the task.
+        
+        Args:
+            manager: Portfolio manager that receives the price
+            symbol: Asset symbol to fetch
+        """
+        super().__init__()
+        self.manager = manager
+        self.symbol = symbol
+        
+    def run(self):
+        """Fetch the price and hand it back to the manager's thread."""
+        price_data = self.manager._request_asset_price(self.symbol)
+        QMetaObject.invokeMethod(
+            self.manager,
+            '_apply_price',
+            Qt.QueuedConnection,
+            Q_ARG(str, self.symbol),
+            Q_ARG(object, price_data)
+        )
+
+
 class PortfolioManager(QObject):
     """Service for managing portfolio and watchlists."""
     
@@ -22,6 +83,10 @@ class PortfolioManager(QObject):
     portfolio_updated = pyqtSignal()
     watchlist_updated = pyqtSignal(str)  # watchlist_name
     asset_updated = pyqtSignal(Asset)
+    assets_updated_batch = pyqtSignal(list)  # List[Asset]
+    prices_refreshed = pyqtSignal()
+    futures_positions_refreshed = pyqtSignal()
+    top_gainers_ready = pyqtSignal(list)  # List[Asset]
     
     def __init__(self, settings: Settings, binance_service: BinanceService):
         """Initialize the portfolio manager.
@@ -36,11 +101,22 @@ class PortfolioManager(QObject):
         self.portfolio = Portfolio()
         self.logger = logging.getLogger(__name__)
         
+        # Guards the portfolio's dicts and sets, which are read and changed
+        # from both the GUI thread and this object's thread
+        self._lock = threading.RLock()
+        
+        # Assets with a positive balance, kept in step with balance updates
+        self._assets_with_balance: Dict[str, Asset] = {}
+        
+        # Symbols still being fetched by refresh_all_prices
+        self._pending_price_refresh: Set[str] = set()
+        
         # Create data directory if it doesn't exist
         self.data_dir = self.settings.ensure_data_directory()
         
         # Load portfolio from file
         self._load_portfolio()
+        self._rebuild_balance_index()
         
         # Connect to Binance service signals
         self.binance_service.price_updated.connect(self._handle_price_update)
@@ -73,7 +149,8 @@ class PortfolioManager(QObject):
         file_path = self._get_portfolio_file_path()
         
         try:
-            self.portfolio.save_to_file(file_path)
+            with self._lock:
+                self.portfolio.save_to_file(file_path)
             self.logger.info(f"Saved portfolio to {file_path}")
             
             # Save active watchlist to settings
@@ -87,7 +164,37 @@ class PortfolioManager(QObject):
         
     def get_all_assets(self) -> List[Asset]:
         """Get all assets in the portfolio."""
-        return list(self.portfolio.assets.values())
+        with self._lock:
+            return list(self.portfolio.assets.values())
+        
+    def get_assets_with_balance(self) -> List[Asset]:
+        """Get the assets with a positive balance.
+        
+        Returns:
+            List[Asset]: Assets with a balance, from an index maintained on balance updates
+        """
+        with self._lock:
+            return list(self._assets_with_balance.values())
+        
+    def _update_balance(self, asset: Asset, balance: float):
+        """Set an asset's balance and keep the balance index current.
+        
+        Args:
+            asset: The asset to update
+            balance: New balance
+        """
+        asset.update_balance(balance)
+        if balance > 0:
+            self._assets_with_balance[asset.symbol] = asset
+        else:
+            self._assets_with_balance.pop(asset.symbol, None)
+            
+    def _rebuild_balance_index(self):
+        """Rebuild the balance index from the portfolio."""
+        self._assets_with_balance = {
+            symbol: asset for symbol, asset in self.portfolio.assets.items()
+            if asset.balance > 0
+        }
         
     def get_watchlist_assets(self, watchlist_name: Optional[str] = None) -> List[Asset]:
         """Get assets in the specified watchlist.
@@ -98,11 +205,13 @@ class PortfolioManager(QObject):
         Returns:
             List[Asset]: List of assets in the watchlist
         """
-        return self.portfolio.get_watchlist_assets(watchlist_name)
+        with self._lock:
+            return self.portfolio.get_watchlist_assets(watchlist_name)
         
     def get_watchlists(self) -> Dict[str, Watchlist]:
-        """Get all watchlists in the portfolio."""
-        return self.portfolio.watchlists
+        """Get a snapshot of all watchlists in the portfolio."""
+        with self._lock:
+            return dict(self.portfolio.watchlists)
         
     def get_active_watchlist(self) -> Watchlist:
         """Get the active watchlist."""
@@ -117,7 +226,8 @@ class PortfolioManager(QObject):
         Returns:
             bool: True if successful, False if not found
         """
-        result = self.portfolio.set_active_watchlist(name)
+        with self._lock:
+            result = self.portfolio.set_active_watchlist(name)
         if result:
             self.settings.set('active_watchlist', name)
             self.watchlist_updated.emit(name)
@@ -133,7 +243,8 @@ class PortfolioManager(QObject):
         Returns:
             bool: True if created, False if name already exists
         """
-        result = self.portfolio.create_watchlist(name)
+        with self._lock:
+            result = self.portfolio.create_watchlist(name)
         if result:
             self.save_portfolio()
             self.portfolio_updated.emit()
@@ -149,7 +260,8 @@ class PortfolioManager(QObject):
         Returns:
             bool: True if deleted, False if not found or is default
         """
-        result = self.portfolio.delete_watchlist(name)
+        with self._lock:
+            result = self.portfolio.delete_watchlist(name)
         if result:
             self.save_portfolio()
             self.portfolio_updated.emit()
@@ -166,16 +278,18 @@ class PortfolioManager(QObject):
         Returns:
             bool: True if added, False if already in watchlist
         """
-        result = self.portfolio.add_to_watchlist(symbol, watchlist_name)
-        if result:
+        with self._lock:
+            result = self.portfolio.add_to_watchlist(symbol, watchlist_name)
+            
             # Ensure we have the asset in our portfolio
-            if symbol not in self.portfolio.assets:
+            if result and symbol not in self.portfolio.assets:
                 asset = Asset(symbol)
                 self.portfolio.add_asset(asset)
                 
                 # Fetch initial price data
                 self._fetch_asset_price(symbol)
                 
+        if result:
             self.save_portfolio()
             target_list = watchlist_name or self.portfolio.active_watchlist_name
             self.watchlist_updated.emit(target_list)
@@ -192,7 +306,8 @@ class PortfolioManager(QObject):
         Returns:
             bool: True if removed, False if not in watchlist
         """
-        result = self.portfolio.remove_from_watchlist(symbol, watchlist_name)
+        with self._lock:
+            result = self.portfolio.remove_from_watchlist(symbol, watchlist_name)
         if result:
             self.save_portfolio()
             target_list = watchlist_name or self.portfolio.active_watchlist_name
@@ -201,11 +316,27 @@ class PortfolioManager(QObject):
         return result
         
     def _fetch_asset_price(self, symbol: str):
-        """Fetch current price for an asset.
+        """Fetch current price for an asset in the background.
+        
+        The REST calls run on the global thread pool; the result is applied
+        on this object's thread via _apply_price.
         
         Args:
             symbol: Asset symbol
         """
+        QThreadPool.globalInstance().start(_FetchPriceRunnable(self, symbol))
+        
+    def _request_asset_price(self, symbol: str) -> Optional[AssetPrice]:
+        """Request current price data for an asset from Binance.
+        
+        This performs blocking HTTP calls and is safe to run off the GUI thread.
+        
+        Args:
+            symbol: Asset symbol
+            
+        Returns:
+            Optional[AssetPrice]: The price data or None on error
+        """
         try:
             ticker = self.binance_service.client.get_symbol_ticker(symbol=symbol)
             price = float(ticker['price'])
@@ -219,51 +350,72 @@ class PortfolioManager(QObject):
                 change_24h = 0.0
                 volume_24h = 0.0
                 
-            price_data = AssetPrice(
+            return AssetPrice(
                 symbol=symbol,
                 price=price,
                 timestamp=stats[0]['closeTime'] if stats and len(stats) > 0 else None,
                 change_24h=change_24h,
                 volume_24h=volume_24h
             )
+        except Exception as e:
+            self.logger.error(f"Error fetching price for {symbol}: {e}")
+            return None
             
+    @pyqtSlot(str, object)
+    def _apply_price(self, symbol: str, price_data: Optional[AssetPrice]):
+        """Apply fetched price data to the matching asset.
+        
+        Emits prices_refreshed once the last fetch of a refresh_all_prices
+        call completes.
+        
+        Args:
+            symbol: Asset symbol
+            price_data: Price data fetched for the asset, or None on error
+        """
+        if price_data is not None:
             asset = self.portfolio.get_asset(symbol)
             if asset:
                 asset.update_price(price_data)
                 self.asset_updated.emit(asset)
-        except Exception as e:
-            self.logger.error(f"Error fetching price for {symbol}: {e}")
+                
+        if symbol in self._pending_price_refresh:
+            self._pending_price_refresh.discard(symbol)
+            if not self._pending_price_refresh:
+                self.prices_refreshed.emit()
             
+    @pyqtSlot()
     def sync_with_binance_account(self):
         """Synchronize portfolio with Binance account balances."""
         account_info = self.binance_service.get_account_info()
         if not account_info:
             return
             
-        for balance in account_info['balances']:
-            asset_name = balance['asset']
-            free = float(balance['free'])
-            locked = float(balance['locked'])
-            total = free + locked
-            
-            # Skip zero balances
-            if total <= 0:
-                continue
+        with self._lock:
+            for balance in account_info['balances']:
+                asset_name = balance['asset']
+                free = float(balance['free'])
+                locked = float(balance['locked'])
+                total = free + locked
                 
-            # Try to find a USDT pair
-            symbol = f"{asset_name}USDT"
-            
-            # Update or create asset
-            asset = self.portfolio.get_asset(symbol)
-            if not asset:
-                asset = Asset(symbol)
-                self.portfolio.add_asset(asset)
+                # Skip zero balances
+                if total <= 0:
+                    continue
+                    
+                # Try to find a USDT pair
+                symbol = f"{asset_name}USDT"
                 
-            asset.update_balance(total)
-            
-            # Fetch price data
-            self._fetch_asset_price(symbol)
-            
+                # Update or create asset
+                asset = self.portfolio.get_asset(symbol)
+                if not asset:
+                    asset = Asset(symbol)
+                    self.portfolio.add_asset(asset)
+                    
+                self._update_balance(asset, total)
+                
+                # Fetch price data
+                self._fetch_asset_price(symbol)
+                
+
         self.portfolio_updated.emit()
         self.save_portfolio()
         
@@ -287,34 +439,59 @@ class PortfolioManager(QObject):
             account_data: Account update data
         """
         if 'B' in account_data:  # Balances
-            for balance in account_data['B']:
-                asset_name = balance['a']  # Asset
-                free = float(balance['f'])  # Free
-                locked = float(balance['l'])  # Locked
-                total = free + locked
-                
-                # Skip zero balances
-                if total <= 0:
-                    continue
+            with self._lock:
+                updated_assets = []
+                for balance in account_data['B']:
+                    asset_name = balance['a']  # Asset
+                    free = float(balance['f'])  # Free
+                    locked = float(balance['l'])  # Locked
+                    total = free + locked
                     
-                # Try to find a USDT pair
-                symbol = f"{asset_name}USDT"
-                
-                # Update or create asset
-                asset = self.portfolio.get_asset(symbol)
-                if not asset:
-                    asset = Asset(symbol)
-                    self.portfolio.add_asset(asset)
+                    # Skip zero balances
+                    if total <= 0:
+                        continue
+                        
+                    # Try to find a USDT pair
+                    symbol = f"{asset_name}USDT"
                     
-                asset.update_balance(total)
-                self.asset_updated.emit(asset)
-                
+                    # Update or create asset
+                    asset = self.portfolio.get_asset(symbol)
+                    if not asset:
+                        asset = Asset(symbol)
+                        self.portfolio.add_asset(asset)
+                        
+                    self._update_balance(asset, total)
+                    updated_assets.append(asset)
+                    
+            self._emit_assets_updated(updated_assets)
             self.portfolio_updated.emit()
             self.save_portfolio()
             
+    def _emit_assets_updated(self, assets: List[Asset]):
+        """Emit a single batched update for several assets.
+        
+        Falls back to per-asset asset_updated signals when nothing is
+        connected to the batch signal.
+        
+        Args:
+            assets: Assets that were updated
+        """
+        if not assets:
+            return
+            
+        if self.receivers(self.assets_updated_batch) > 0:
+            self.assets_updated_batch.emit(assets)
+        else:
+            for asset in assets:
+                self.asset_updated.emit(asset)
+            
+    @pyqtSlot(str, int)
     def get_top_gainers(self, timeframe: str = '24h', limit: int = 10) -> List[Asset]:
         """Get top gaining assets by price change.
         
+        Performs a blocking REST call; invoke it queued onto this object's
+        thread and take the result from top_gainers_ready.
+        
         Args:
             timeframe: Timeframe for price change ('4h' or '24h')
             limit: Maximum number of assets to return
@@ -333,19 +510,28 @@ class PortfolioManager(QObject):
             limit=limit
         )
         
+        # Parse the change percentage once per mover and keep only the top
+        # entries before materializing any assets
+        top = heapq.nlargest(
+            limit,
+            ((float(mover['priceChangePercent']), mover) for mover in movers),
+            key=lambda item: item[0]
+        )
+        
         result = []
-        for mover in movers:
+        for change_pct, mover in top:
             symbol = mover['symbol']
             
             # Get or create asset
-            asset = self.portfolio.get_asset(symbol)
-            if not asset:
-                asset = Asset(symbol)
-                self.portfolio.add_asset(asset)
+            with self._lock:
+                asset = self.portfolio.get_asset(symbol)
+                if not asset:
+                    asset = Asset(symbol)
+                    self.portfolio.add_asset(asset)
                 
             # Update price data
             price = float(mover['lastPrice'])
-            change = float(mover['priceChangePercent']) / 100
+            change = change_pct / 100
             volume = float(mover['volume'])
             
             price_data = AssetPrice(
@@ -360,82 +546,119 @@ class PortfolioManager(QObject):
             asset.update_price(price_data)
             result.append(asset)
             
+        self.top_gainers_ready.emit(result)
         return result
         
     def start_price_updates(self):
         """Start real-time price updates for watched assets."""
         # Get all symbols in watchlists
         all_symbols = set()
-        for watchlist in self.portfolio.watchlists.values():
-            all_symbols.update(watchlist.symbols)
+        with self._lock:
+            for watchlist in self.portfolio.watchlists.values():
+                all_symbols.update(watchlist.symbols)
             
         # Start ticker stream for these symbols
         if all_symbols:
             self.binance_service.start_ticker_stream(list(all_symbols))
             
+    @pyqtSlot()
     def refresh_all_prices(self):
-        """Manually refresh prices for all assets in the portfolio."""
-        for symbol in self.portfolio.assets:
+        """Manually refresh prices for all assets in the portfolio.
+        
+        The prices are fetched in the background; prices_refreshed is
+        emitted once all of them have been applied.
+        """
+        with self._lock:
+            symbols = list(self.portfolio.assets)
+        if not symbols:
+            self.prices_refreshed.emit()
+            return
+            
+        self._pending_price_refresh.update(symbols)
+        for symbol in symbols:
             self._fetch_asset_price(symbol)
             
+    @pyqtSlot()
     def update_futures_positions(self) -> bool:
         """Update the Futures Positions watchlist with current positions.
         
+        Emits futures_positions_refreshed when done, whether or not the
+        positions could be fetched.
+        
         Returns:
             bool: True if successful, False if API error
         """
         # Get futures positions from Binance
         positions = self.binance_service.get_futures_positions()
         if not positions:
+            self.futures_positions_refreshed.emit()
             return False
             
-        # Get the futures positions watchlist
-        futures_watchlist = self.portfolio.watchlists.get('futures_positions')
-        if not futures_watchlist:
-            futures_watchlist = self.portfolio.create_watchlist('Futures Positions')
-            self.portfolio.watchlists['futures_positions'] = futures_watchlist
-            
-        # Clear previous positions
-        futures_watchlist.symbols.clear()
-        
-        # Add current positions
-        for position in positions:
-            symbol = position['symbol']
-            position_amt = float(position.get('positionAmt', 0))
-            
-            # Skip positions with zero amount
-            if position_amt == 0:
-                continue
+        with self._lock:
+            # Get the futures positions watchlist
+            futures_watchlist = self.portfolio.watchlists.get('futures_positions')
+            if not futures_watchlist:
+                futures_watchlist = self.portfolio.create_watchlist('Futures Positions')
+                self.portfolio.watchlists['futures_positions'] = futures_watchlist
                 
-            # Add to watchlist
-            futures_watchlist.add_symbol(symbol)
-            
-            # Create or update asset
-            asset = self.portfolio.get_asset(symbol)
-            if not asset:
-                asset = Asset(symbol, AssetType.FUTURES)
-                self.portfolio.add_asset(asset)
-            
-            # Calculate position value
-            position_value = abs(position_amt) * float(position.get('markPrice', 0))
-            leverage = float(position.get('leverage', 1))
+            # Collect the current position symbols
+            new_symbols = set()
             
-            # Update asset with position info
-            asset.update_balance(abs(position_amt))
-            asset.is_long = position_amt > 0
-            asset.is_short = position_amt < 0
-            asset.leverage = leverage
-            
-            # Fetch full price data
-            self._fetch_asset_price(symbol)
+            # Update current positions
+            for position in positions:
+                symbol = position['symbol']
+                position_amt = float(position.get('positionAmt', 0))
+                
+                # Skip positions with zero amount
+                if position_amt == 0:
+                    continue
+                    
+                new_symbols.add(symbol)
+                
+                # Create or update asset
+                asset = self.portfolio.get_asset(symbol)
+                if not asset:
+                    asset = Asset(symbol, AssetType.FUTURES)
+                    self.portfolio.add_asset(asset)
+                
+                # Calculate position value
+                mark_price = float(position.get('markPrice', 0))
+                position_value = abs(position_amt) * mark_price
+                leverage = float(position.get('leverage', 1))
+                
+                # Update asset with position info
+                self._update_balance(asset, abs(position_amt))
+                asset.is_long = position_amt > 0
+                asset.is_short = position_amt < 0
+                asset.leverage = leverage
+                
+                # Use the mark price from the position payload and keep the 24h
+                # stats already known; fall back to a full price fetch when the
+                # mark price is missing or the asset has no stats yet
+                previous = asset.price_data
+                if mark_price > 0 and previous is not None:
+                    asset.update_price(AssetPrice(
+                        symbol=symbol,
+                        price=mark_price,
+                        timestamp=None,
+                        change_24h=previous.change_24h,
+                        change_4h=previous.change_4h,
+                        volume_24h=previous.volume_24h
+                    ))
+                else:
+                    self._fetch_asset_price(symbol)
+                
+                # Emit update signal
+                self.asset_updated.emit(asset)
+                
+            # Update timestamp
+            self.portfolio.futures_positions_updated = time.time()
             
-            # Emit update signal
-            self.asset_updated.emit(asset)
+            # Only touch the watchlist when the set of positions actually changed
+            if new_symbols != futures_watchlist.symbols:
+                futures_watchlist.symbols = new_symbols
+                futures_watchlist.updated_at = datetime.now()
+                self.watchlist_updated.emit('futures_positions')
             
-        # Update timestamp
-        self.portfolio.futures_positions_updated = datetime.now()
-        
-        # Emit signals
-        self.watchlist_updated.emit('futures_positions')
-        
+        self.futures_positions_refreshed.emit()
         return True
@@ -4,8 +4,9 @@ Strategy manager service for handling trading strategies.
 import json
 import logging
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
@@ -22,7 +23,9 @@ class StrategyManager(QObject):
     # Define signals for strategy updates
     strategy_assigned = pyqtSignal(str, str)  # symbol, strategy_id
     strategy_removed = pyqtSignal(str, str)  # symbol, strategy_id
+    strategies_cleared = pyqtSignal(str)  # symbol
     signal_generated = pyqtSignal(Signal)
+    signals_refreshed = pyqtSignal()
     
     def __init__(self, settings: Settings, binance_service: BinanceService):
         """Initialize the strategy manager.
@@ -114,6 +117,34 @@ class StrategyManager(QObject):
         """
         return StrategyRegistry.get_strategy(strategy_id)
         
+    @pyqtSlot(str, object)
+    def configure_strategy(self, strategy_id: str, parameters: Dict[str, Any]) -> bool:
+        """Apply new parameters to a strategy and refresh all signals.
+        
+        Runs on this object's thread so a signal pass never sees a partly
+        applied configuration.
+        
+        Args:
+            strategy_id: Strategy ID
+            parameters: Parameter values keyed by name
+            
+        Returns:
+            bool: True if applied, False if the strategy was not found
+        """
+        strategy = self.get_strategy(strategy_id)
+        if not strategy:
+            self.logger.error(f"Strategy {strategy_id} not found")
+            return False
+            
+        for name, value in parameters.items():
+            strategy.set_parameter(name, value)
+            
+        # Refresh signals using the new parameters
+        self.refresh_all_signals()
+        
+        return True
+        
+    @pyqtSlot(str, str)
     def assign_strategy(self, symbol: str, strategy_id: str) -> bool:
         """Assign a strategy to an asset.
         
@@ -150,6 +181,7 @@ class StrategyManager(QObject):
         
         return True
         
+    @pyqtSlot(str, str)
     def remove_strategy(self, symbol: str, strategy_id: str) -> bool:
         """Remove a strategy from an asset.
         
@@ -184,6 +216,34 @@ class StrategyManager(QObject):
         
         return True
         
+    @pyqtSlot(str)
+    def remove_all_strategies(self, symbol: str) -> bool:
+        """Remove every strategy from an asset.
+        
+        Saves once and emits a single strategies_cleared signal instead of
+        one strategy_removed signal per strategy.
+        
+        Args:
+            symbol: Asset symbol
+            
+        Returns:
+            bool: True if any strategy was removed, False if none were assigned
+        """
+        strategy_ids = self.asset_strategies.pop(symbol, None)
+        if not strategy_ids:
+            return False
+            
+        self._save_strategy_assignments()
+        
+        # Remove any active signals for these assignments
+        for strategy_id in strategy_ids:
+            self.active_signals.pop((symbol, strategy_id), None)
+            
+        # Emit signal
+        self.strategies_cleared.emit(symbol)
+        
+        return True
+        
     def get_asset_strategies(self, symbol: str) -> List[Strategy]:
         """Get all strategies assigned to an asset.
         
@@ -193,12 +253,11 @@ class StrategyManager(QObject):
         Returns:
             List[Strategy]: List of assigned strategies
         """
-        if symbol not in self.asset_strategies:
-            return []
-            
+        # Iterate over a copy; assignments change on the manager's thread
+        strategy_ids = list(self.asset_strategies.get(symbol, ()))
         return [
             self.get_strategy(strategy_id)
-            for strategy_id in self.asset_strategies[symbol]
+            for strategy_id in strategy_ids
             if self.get_strategy(strategy_id) is not None
         ]
         
@@ -209,9 +268,9 @@ class StrategyManager(QObject):
             symbol: Asset symbol
             
         Returns:
-            Set[str]: Set of assigned strategy IDs
+            Set[str]: Copy of the set of assigned strategy IDs
         """
-        return self.asset_strategies.get(symbol, set())
+        return set(self.asset_strategies.get(symbol, ()))
         
     def get_assets_with_strategies(self) -> List[str]:
         """Get all assets that have strategies assigned.
@@ -278,7 +337,35 @@ class StrategyManager(QObject):
         signal_key = (symbol, strategy_id)
         return self.active_signals.get(signal_key)
         
-    def _clean_symbol(self, symbol: str) -> str:
+    def get_signals_bulk(
+        self, symbols: Iterable[str], strategy_ids: Iterable[str]
+    ) -> Dict[Tuple[str, str], Signal]:
+        """Get the most recent signals for several symbols and strategies at once.
+        
+        Looks up each requested pair instead of scanning active_signals, which
+        the manager's thread may be changing.
+        
+        Args:
+            symbols: Asset symbols
+            strategy_ids: Strategy IDs
+            
+        Returns:
+            Dict[Tuple[str, str], Signal]: Signals keyed by (symbol, strategy_id);
+            combinations without a signal are omitted
+        """
+        active_signals = self.active_signals
+        strategy_ids = tuple(strategy_ids)
+        result = {}
+        for symbol in symbols:
+            for strategy_id in strategy_ids:
+                signal = active_signals.get((symbol, strategy_id))
+                if signal is not None:
+                    result[(symbol, strategy_id)] = signal
+        return result
+        
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _clean_symbol(symbol: str) -> str:
         """Clean a symbol for API usage by removing illegal characters.
         
         Args:
@@ -287,11 +374,11 @@ class StrategyManager(QObject):
         Returns:
             str: A clean symbol suitable for API calls
         """
-        # If symbol contains spaces, extract just the first part before any spaces
+        # Extract just the first part before any spaces (returns the symbol
+        # unchanged if there are none). Results are cached since the same raw
+        # symbols recur on every refresh.
         # This assumes symbol format like "BTCUSDT LONG 10x"
-        if " " in symbol:
-            return symbol.split()[0]
-        return symbol
+        return symbol.partition(" ")[0]
         
     def get_asset_signals(self, symbol: str) -> List[Signal]:
         """Get all active signals for an asset.
@@ -319,6 +406,7 @@ class StrategyManager(QObject):
         """
         return self.generate_signal(symbol, strategy_id)
         
+    @pyqtSlot(str)
     def refresh_asset_signals(self, symbol: str) -> List[Signal]:
         """Refresh all signals for an asset.
         
@@ -339,11 +427,14 @@ class StrategyManager(QObject):
                 
         return result
         
+    @pyqtSlot()
     def refresh_all_signals(self):
-        """Refresh all signals for all assets."""
-        for symbol in self.asset_strategies:
+        """Refresh all signals for all assets and emit signals_refreshed."""
+        for symbol in list(self.asset_strategies):
             self.refresh_asset_signals(symbol)
+        self.signals_refreshed.emit()
             
+    @pyqtSlot()
     def start_auto_refresh(self, interval_ms: Optional[int] = None):
         """Start auto-refreshing signals.
         
@@ -357,6 +448,7 @@ class StrategyManager(QObject):
         self.refresh_timer.start(self.refresh_interval)
         self.logger.info(f"Started auto-refresh with interval {self.refresh_interval}ms")
         
+    @pyqtSlot()
     def stop_auto_refresh(self):
         """Stop auto-refreshing signals."""
         self.refresh_timer.stop()
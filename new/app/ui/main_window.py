@@ -3,7 +3,11 @@ Main window of the application.
 """
 import sys
 import logging
-from typing import Optional
+import logging.handlers
+import queue
+import time
+from functools import partial
+from typing import Optional, Set
 
 from PyQt5.QtWidgets import (
     QMainWindow, QTabWidget, QVBoxLayout, QWidget, 
@@ -11,8 +15,10 @@ from PyQt5.QtWidgets import (
     QDialog, QDialogButtonBox, QFormLayout, QLabel,
     QLineEdit, QCheckBox
 )
-from PyQt5.QtCore import Qt, QSettings
-from PyQt5.QtGui import QIcon, QFont
+from PyQt5.QtCore import (
+    Qt, QSettings, QThread, QMetaObject, QTimer
+)
+from PyQt5.QtGui import QIcon, QFont, QPixmap, QPixmapCache
 
 from app.ui.portfolio_tab import PortfolioTab
 from app.ui.signals_tab import SignalsTab
@@ -26,6 +32,22 @@ from app.services.strategy_manager import StrategyManager
 from app.config.settings import Settings
 
 
+def _cached_icon(path: str) -> QIcon:
+    """Create an icon from an image file, decoding each file only once.
+    
+    Args:
+        path: Path to the image file
+        
+    Returns:
+        QIcon: Icon backed by the cached pixmap
+    """
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        QPixmapCache.insert(path, pixmap)
+    return QIcon(pixmap)
+
+
 class ApiKeyDialog(QDialog):
     """Dialog for entering Binance API keys."""
     
@@ -92,11 +114,29 @@ class ApiKeyDialog(QDialog):
             tuple: (API key, API secret)
         """
         return (self.api_key_edit.text(), self.api_secret_edit.text())
+        
+    def set_api_credentials(self, api_key: str, api_secret: str):
+        """Fill the dialog with the given API credentials.
+        
+        Args:
+            api_key: API key to show
+            api_secret: API secret to show
+        """
+        self.api_key_edit.setText(api_key)
+        self.api_secret_edit.setText(api_secret)
+        self.show_secret_check.setChecked(False)
 
 
 class MainWindow(QMainWindow):
     """Main application window."""
     
+    # Stylesheets, formatted once
+    _STYLE_TITLE = f"color: {DarkThemeColors.ACCENT}; margin-bottom: 10px;"
+    _STYLE_STATUS_BAR = f"background-color: {DarkThemeColors.CARD_BACKGROUND};"
+    _STYLE_CONN_PENDING = f"color: {DarkThemeColors.WARNING};"
+    _STYLE_CONN_OK = f"color: {DarkThemeColors.SUCCESS}; font-weight: bold;"
+    _STYLE_CONN_BAD = f"color: {DarkThemeColors.ERROR}; font-weight: bold;"
+    
     def __init__(self):
         """Initialize the main window."""
         super().__init__()
@@ -106,12 +146,33 @@ class MainWindow(QMainWindow):
         
         # Initialize settings
         self.settings = Settings()
+        self._qsettings = QSettings("CryptoPortfolioManager", "MainWindow")
+        self._has_api = bool(self.settings.get('api_key') and self.settings.get('api_secret'))
         
         # Initialize services
         self.binance_service = BinanceService(self.settings)
         self.portfolio_manager = PortfolioManager(self.settings, self.binance_service)
         self.strategy_manager = StrategyManager(self.settings, self.binance_service)
         
+        # Run the stateful services on their own threads so network I/O never
+        # blocks the UI. The Binance service stays on this thread: its REST
+        # calls run synchronously on whichever thread makes them, and its
+        # websocket streams need this thread's event loop.
+        self._portfolio_thread = self._start_service_thread(self.portfolio_manager)
+        self._strategy_thread = self._start_service_thread(self.strategy_manager)
+        
+        # API key dialog, created on first use
+        self._api_dialog: Optional[ApiKeyDialog] = None
+        
+        # Parts of a manual refresh that have not completed yet
+        self._pending_refresh_parts: Set[str] = set()
+        
+        # Coalesce bursts of portfolio updates into one menu reconciliation
+        self._portfolio_update_timer = QTimer(self)
+        self._portfolio_update_timer.setSingleShot(True)
+        self._portfolio_update_timer.setInterval(250)
+        self._portfolio_update_timer.timeout.connect(self._do_portfolio_update)
+        
         # Setup UI
         self._setup_ui()
         
@@ -122,22 +183,53 @@ class MainWindow(QMainWindow):
         self._start_data_updates()
         
     def _setup_logging(self):
-        """Setup logging for the application."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler()
-            ]
-        )
+        """Setup logging for the application.
+        
+        Records are only queued on the emitting thread; formatting and the
+        stream write happen on a background listener thread.
+        """
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%H:%M:%S'
+        ))
+        
+        log_queue = queue.SimpleQueue()
+        root_logger = logging.getLogger()
+        root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        root_logger.setLevel(logging.INFO)
+        
+        self._log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        self._log_listener.start()
+        
         self.logger = logging.getLogger(__name__)
         
+    def _start_service_thread(self, service) -> QThread:
+        """Move a service to a dedicated worker thread and start it.
+        
+        Args:
+            service: Service object to move
+            
+        Returns:
+            QThread: The started thread
+        """
+        thread = QThread(self)
+        service.moveToThread(thread)
+        thread.start()
+        return thread
+        
+    def _stop_service_threads(self):
+        """Stop all service worker threads."""
+        for thread in (self._strategy_thread, self._portfolio_thread):
+            thread.quit()
+            thread.wait()
+            
     def _setup_ui(self):
         """Setup the user interface."""
         # Configure window
         self.setWindowTitle("Crypto Portfolio Manager")
         self.setMinimumSize(1000, 700)
-        self.setWindowIcon(QIcon("app/ui/assets/icon.png"))
+        self.setWindowIcon(_cached_icon("app/ui/assets/icon.png"))
         
         # Create central widget and layout
         central_widget = QWidget()
@@ -150,7 +242,7 @@ class MainWindow(QMainWindow):
         title_label = QLabel("Crypto Portfolio Manager")
         title_font = QFont("Segoe UI", 16, QFont.Bold)
         title_label.setFont(title_font)
-        title_label.setStyleSheet(f"color: {DarkThemeColors.ACCENT}; margin-bottom: 10px;")
+        title_label.setStyleSheet(self._STYLE_TITLE)
         layout.addWidget(title_label)
         
         # Create tab widget with styling
@@ -165,37 +257,86 @@ class MainWindow(QMainWindow):
             self.portfolio_manager, 
             self.strategy_manager
         )
-        self.signals_tab = SignalsTab(
-            self.binance_service, 
-            self.portfolio_manager, 
-            self.strategy_manager
-        )
-        self.strategies_tab = StrategiesTab(
-            self.binance_service, 
-            self.portfolio_manager, 
-            self.strategy_manager
-        )
+        # Signals and strategies tabs are built on first activation
+        self.signals_tab: Optional[SignalsTab] = None
+        self.strategies_tab: Optional[StrategiesTab] = None
         
-        # Add tabs to tab widget
+        # Add tabs to tab widget (placeholders for the lazily built tabs)
         self.tab_widget.addTab(self.portfolio_tab, "Portfolio")
-        self.tab_widget.addTab(self.signals_tab, "Signals")
-        self.tab_widget.addTab(self.strategies_tab, "Strategies")
+        self.tab_widget.addTab(QWidget(), "Signals")
+        self.tab_widget.addTab(QWidget(), "Strategies")
+        self._tabs_built = {0: True}
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         # Create status bar with styling
         self.status_bar = QStatusBar()
-        self.status_bar.setStyleSheet(f"background-color: {DarkThemeColors.CARD_BACKGROUND};")
+        self.status_bar.setStyleSheet(self._STYLE_STATUS_BAR)
         self.setStatusBar(self.status_bar)
         
         # Create connection status label
         self.connection_status_label = QLabel("Not connected")
-        self.connection_status_label.setStyleSheet(f"color: {DarkThemeColors.WARNING};")
+        self.connection_status_label.setStyleSheet(self._STYLE_CONN_PENDING)
+        self._was_connected = None
         self.status_bar.addPermanentWidget(self.connection_status_label)
         
+        # Create error banner, cleared automatically a few seconds after the last error
+        self.error_banner = QLabel()
+        self.error_banner.setStyleSheet(self._STYLE_CONN_BAD)
+        self.error_banner.hide()
+        self.status_bar.addWidget(self.error_banner, 1)
+        
+        self._error_banner_timer = QTimer(self)
+        self._error_banner_timer.setSingleShot(True)
+        self._error_banner_timer.setInterval(5000)
+        self._error_banner_timer.timeout.connect(self.error_banner.hide)
+        
+        # Modal error dialogs are rate limited
+        self._last_error_shown_ts = 0.0
+        self._last_error_message = None
+        
         # Create menu bar
         self._create_menus()
         
-        # Load window state
-        self._load_window_state()
+        # Window state is restored on the first show
+        self._restored = False
+        
+    def _ensure_tab_built(self, index: int):
+        """Build a lazily constructed tab the first time it is shown.
+        
+        Args:
+            index: Index of the activated tab
+        """
+        if self._tabs_built.get(index):
+            return
+            
+        if index == 1:
+            self.signals_tab = SignalsTab(
+                self.binance_service, 
+                self.portfolio_manager, 
+                self.strategy_manager
+            )
+            tab = self.signals_tab
+        elif index == 2:
+            self.strategies_tab = StrategiesTab(
+                self.binance_service, 
+                self.portfolio_manager, 
+                self.strategy_manager
+            )
+            tab = self.strategies_tab
+        else:
+            return
+            
+        self._tabs_built[index] = True
+        
+        # Swap the placeholder for the real tab
+        title = self.tab_widget.tabText(index)
+        self.tab_widget.blockSignals(True)
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.removeTab(index)
+        placeholder.deleteLater()
+        self.tab_widget.insertTab(index, tab, title)
+        self.tab_widget.setCurrentIndex(index)
+        self.tab_widget.blockSignals(False)
         
     def _create_menus(self):
         """Create application menus."""
@@ -222,7 +363,7 @@ class MainWindow(QMainWindow):
         
         # Futures positions action
         futures_positions_action = QAction("My Futures Positions", self)
-        futures_positions_action.setIcon(QIcon("app/ui/assets/futures.png"))  # You may need to create this asset
+        futures_positions_action.setIcon(_cached_icon("app/ui/assets/futures.png"))  # You may need to create this asset
         futures_positions_action.triggered.connect(self._show_futures_positions)
         futures_positions_action.setStatusTip("View your active Binance Futures positions")
         view_menu.addAction(futures_positions_action)
@@ -231,17 +372,19 @@ class MainWindow(QMainWindow):
         
         watchlist_menu = QMenu("Watchlists", self)
         view_menu.addMenu(watchlist_menu)
+        self.watchlist_menu = watchlist_menu
         
         self.watchlist_actions = {}
+        self._active_watchlist_action = None
+        self._last_watchlists_key = tuple(self.portfolio_manager.get_watchlists())
         for name in self.portfolio_manager.get_watchlists():
             action = QAction(name, self)
             action.setCheckable(True)
-            action.setData(name)
-            action.triggered.connect(self._on_watchlist_selected)
+            action.triggered.connect(partial(self._activate_watchlist, name))
             watchlist_menu.addAction(action)
             self.watchlist_actions[name] = action
             
-        watchlist_menu.addSeparator()
+        self._watchlist_separator_action = watchlist_menu.addSeparator()
         
         new_watchlist_action = QAction("New Watchlist...", self)
         new_watchlist_action.triggered.connect(self._create_new_watchlist)
@@ -258,18 +401,29 @@ class MainWindow(QMainWindow):
         """Connect signals from services."""
         # Connect Binance service signals
         self.binance_service.connection_status_changed.connect(
-            self._on_connection_status_changed
+            self._on_connection_status_changed, Qt.QueuedConnection
         )
         self.binance_service.error_occurred.connect(
-            self._on_error_occurred
+            self._on_error_occurred, Qt.QueuedConnection
         )
         
         # Connect portfolio manager signals
         self.portfolio_manager.portfolio_updated.connect(
-            self._on_portfolio_updated
+            self._on_portfolio_updated, Qt.QueuedConnection
         )
         self.portfolio_manager.watchlist_updated.connect(
-            self._on_watchlist_updated
+            self._on_watchlist_updated, Qt.QueuedConnection
+        )
+        
+        # Connect refresh completion signals
+        self.portfolio_manager.prices_refreshed.connect(
+            partial(self._on_refresh_part_finished, 'prices'), Qt.QueuedConnection
+        )
+        self.portfolio_manager.futures_positions_refreshed.connect(
+            partial(self._on_refresh_part_finished, 'futures'), Qt.QueuedConnection
+        )
+        self.strategy_manager.signals_refreshed.connect(
+            partial(self._on_refresh_part_finished, 'signals'), Qt.QueuedConnection
         )
         
     def _start_data_updates(self):
@@ -277,22 +431,29 @@ class MainWindow(QMainWindow):
         # Start price updates for watched assets
         self.portfolio_manager.start_price_updates()
         
-        # Start auto-refresh for signals
-        self.strategy_manager.start_auto_refresh()
+        # Start auto-refresh for signals (the timer lives on the strategy thread)
+        QMetaObject.invokeMethod(
+            self.strategy_manager, "start_auto_refresh", Qt.QueuedConnection
+        )
         
     def _load_window_state(self):
         """Load window state from settings."""
-        qsettings = QSettings("CryptoPortfolioManager", "MainWindow")
-        if qsettings.contains("geometry"):
-            self.restoreGeometry(qsettings.value("geometry"))
-        if qsettings.contains("windowState"):
-            self.restoreState(qsettings.value("windowState"))
+        if self._qsettings.contains("geometry"):
+            self.restoreGeometry(self._qsettings.value("geometry"))
+        if self._qsettings.contains("windowState"):
+            self.restoreState(self._qsettings.value("windowState"))
             
+    def showEvent(self, event):
+        """Restore the saved window state the first time the window is shown."""
+        if not self._restored:
+            self._load_window_state()
+            self._restored = True
+        super().showEvent(event)
+        
     def _save_window_state(self):
         """Save window state to settings."""
-        qsettings = QSettings("CryptoPortfolioManager", "MainWindow")
-        qsettings.setValue("geometry", self.saveGeometry())
-        qsettings.setValue("windowState", self.saveState())
+        self._qsettings.setValue("geometry", self.saveGeometry())
+        self._qsettings.setValue("windowState", self.saveState())
         
     def closeEvent(self, event):
         """Handle window close event."""
@@ -305,6 +466,12 @@ class MainWindow(QMainWindow):
         # Close connections
         self.binance_service.close_connections()
         
+        # Stop service threads
+        self._stop_service_threads()
+        
+        # Flush pending log records
+        self._log_listener.stop()
+        
         # Accept the event
         event.accept()
         
@@ -313,30 +480,51 @@ class MainWindow(QMainWindow):
         api_key = self.settings.get('api_key', '')
         api_secret = self.settings.get('api_secret', '')
         
-        dialog = ApiKeyDialog(self, api_key, api_secret)
+        # Build the dialog once and reuse it
+        if self._api_dialog is None:
+            self._api_dialog = ApiKeyDialog(self)
+        dialog = self._api_dialog
+        dialog.set_api_credentials(api_key, api_secret)
+        
         if dialog.exec_() == QDialog.Accepted:
             new_key, new_secret = dialog.get_api_credentials()
             self.binance_service.update_credentials(new_key, new_secret)
+            self._has_api = bool(new_key and new_secret)
             
-            # Sync portfolio with Binance account
-            if new_key and new_secret:
-                self.portfolio_manager.sync_with_binance_account()
+            # Sync portfolio with Binance account on the portfolio thread
+            if self._has_api:
+                QMetaObject.invokeMethod(
+                    self.portfolio_manager, "sync_with_binance_account", Qt.QueuedConnection
+                )
                 
     def _refresh_data(self):
-        """Refresh all data."""
-        # Refresh prices
-        self.portfolio_manager.refresh_all_prices()
+        """Refresh all data in parallel on the services' own threads."""
+        calls = [(self.portfolio_manager, "refresh_all_prices", 'prices')]
         
         # Refresh futures positions if we have API keys
-        if self.settings.get('api_key') and self.settings.get('api_secret'):
-            self.portfolio_manager.update_futures_positions()
-        
+        if self._has_api:
+            calls.append((self.portfolio_manager, "update_futures_positions", 'futures'))
+            
         # Refresh signals
-        self.strategy_manager.refresh_all_signals()
+        calls.append((self.strategy_manager, "refresh_all_signals", 'signals'))
         
-        # Update status bar
-        self.status_bar.showMessage("Data refreshed", 3000)
+        for service, slot, part in calls:
+            self._pending_refresh_parts.add(part)
+            QMetaObject.invokeMethod(service, slot, Qt.QueuedConnection)
+            
+    def _on_refresh_part_finished(self, part: str):
+        """Update the status bar once the last part of a refresh completes.
         
+        Args:
+            part: Name of the completed part
+        """
+        if part not in self._pending_refresh_parts:
+            return
+            
+        self._pending_refresh_parts.discard(part)
+        if not self._pending_refresh_parts:
+            self.status_bar.showMessage("Data refreshed", 3000)
+            
     def _show_futures_positions(self):
         """Show futures positions tab."""
         # Switch to portfolio tab and show futures positions
@@ -355,24 +543,11 @@ class MainWindow(QMainWindow):
                 # Add to menu
                 action = QAction(name, self)
                 action.setCheckable(True)
-                action.setData(name)
-                action.triggered.connect(self._on_watchlist_selected)
+                action.triggered.connect(partial(self._activate_watchlist, name))
+                
+                # Insert before the separator
+                self.watchlist_menu.insertAction(self._watchlist_separator_action, action)
                 
-                watchlist_menu = None
-                for menu in self.menuBar().findChildren(QMenu):
-                    if menu.title() == "Watchlists":
-                        watchlist_menu = menu
-                        break
-                        
-                if watchlist_menu:
-                    # Find position before the separator
-                    actions = watchlist_menu.actions()
-                    sep_index = next(
-                        (i for i, a in enumerate(actions) if a.isSeparator()), 
-                        len(actions)
-                    )
-                    watchlist_menu.insertAction(actions[sep_index], action)
-                    
                 self.watchlist_actions[name] = action
                 
                 # Set as active
@@ -404,10 +579,15 @@ class MainWindow(QMainWindow):
         """
         if connected:
             self.connection_status_label.setText(f"✓ {message}")
-            self.connection_status_label.setStyleSheet(f"color: {DarkThemeColors.SUCCESS}; font-weight: bold;")
         else:
             self.connection_status_label.setText(f"✗ {message}")
-            self.connection_status_label.setStyleSheet(f"color: {DarkThemeColors.ERROR}; font-weight: bold;")
+            
+        # Only restyle when the connection state actually changes
+        if connected != self._was_connected:
+            self.connection_status_label.setStyleSheet(
+                self._STYLE_CONN_OK if connected else self._STYLE_CONN_BAD
+            )
+            self._was_connected = connected
             
     def _on_error_occurred(self, error_message):
         """Handle errors from services.
@@ -415,61 +595,66 @@ class MainWindow(QMainWindow):
         Args:
             error_message: Error message
         """
-        self.status_bar.showMessage(error_message, 5000)
-        # Create a more visible error notification
-        QMessageBox.warning(
-            self,
-            "Error",
-            error_message,
-            QMessageBox.Ok
-        )
         self.logger.error(error_message)
         
+        # Show a non-blocking banner in the status bar
+        self.error_banner.setText(error_message)
+        self.error_banner.show()
+        self._error_banner_timer.start()
+        
+        # Only promote new errors to a modal dialog, at most once every 30 s
+        now = time.monotonic()
+        if (error_message != self._last_error_message and 
+                now - self._last_error_shown_ts > 30):
+            self._last_error_shown_ts = now
+            self._last_error_message = error_message
+            QMessageBox.warning(
+                self,
+                "Error",
+                error_message,
+                QMessageBox.Ok
+            )
+        
     def _on_portfolio_updated(self):
-        """Handle portfolio updates."""
+        """Handle portfolio updates, throttled to at most one every 250 ms."""
+        if not self._portfolio_update_timer.isActive():
+            self._portfolio_update_timer.start()
+            
+    def _do_portfolio_update(self):
+        """Reconcile the watchlist menu with the portfolio."""
+        # Fast path: the watchlist names are unchanged since the last update
+        watchlists_key = tuple(self.portfolio_manager.get_watchlists())
+        if watchlists_key == self._last_watchlists_key:
+            return
+        self._last_watchlists_key = watchlists_key
+        
         # Update watchlist actions
-        watchlists = self.portfolio_manager.get_watchlists()
+        current = set(self.watchlist_actions)
+        target = set(watchlists_key)
+        to_add = target - current
+        to_remove = current - target
+        
+        # Nothing to do in the common case of an unchanged watchlist set
+        if not to_add and not to_remove:
+            return
         
         # Add new watchlists
-        for name in watchlists:
-            if name not in self.watchlist_actions:
-                action = QAction(name, self)
-                action.setCheckable(True)
-                action.setData(name)
-                action.triggered.connect(self._on_watchlist_selected)
-                
-                watchlist_menu = None
-                for menu in self.menuBar().findChildren(QMenu):
-                    if menu.title() == "Watchlists":
-                        watchlist_menu = menu
-                        break
-                        
-                if watchlist_menu:
-                    # Find position before the separator
-                    actions = watchlist_menu.actions()
-                    sep_index = next(
-                        (i for i, a in enumerate(actions) if a.isSeparator()), 
-                        len(actions)
-                    )
-                    watchlist_menu.insertAction(actions[sep_index], action)
-                    
-                self.watchlist_actions[name] = action
+        for name in to_add:
+            action = QAction(name, self)
+            action.setCheckable(True)
+            action.triggered.connect(partial(self._activate_watchlist, name))
+            
+            # Insert before the separator
+            self.watchlist_menu.insertAction(self._watchlist_separator_action, action)
+            
+            self.watchlist_actions[name] = action
                 
         # Remove deleted watchlists
-        for name in list(self.watchlist_actions.keys()):
-            if name not in watchlists:
-                action = self.watchlist_actions[name]
-                
-                watchlist_menu = None
-                for menu in self.menuBar().findChildren(QMenu):
-                    if menu.title() == "Watchlists":
-                        watchlist_menu = menu
-                        break
-                        
-                if watchlist_menu:
-                    watchlist_menu.removeAction(action)
-                    
-                del self.watchlist_actions[name]
+        for name in to_remove:
+            action = self.watchlist_actions.pop(name)
+            self.watchlist_menu.removeAction(action)
+            if action is self._active_watchlist_action:
+                self._active_watchlist_action = None
                 
     def _on_watchlist_updated(self, watchlist_name):
         """Handle watchlist updates.
@@ -477,20 +662,32 @@ class MainWindow(QMainWindow):
         Args:
             watchlist_name: Name of the updated watchlist
         """
-        # Update watchlist action check state
+        # Update watchlist action check state, touching only the affected actions
         active_watchlist = self.portfolio_manager.get_active_watchlist().name
+        new_action = self.watchlist_actions.get(active_watchlist)
         
-        for name, action in self.watchlist_actions.items():
-            action.setChecked(name == active_watchlist)
+        if new_action is self._active_watchlist_action:
+            # Re-check in case the user toggled the active action off
+            if new_action is not None:
+                new_action.setChecked(True)
+            return
             
-    def _on_watchlist_selected(self):
-        """Handle watchlist selection from menu."""
-        action = self.sender()
-        if action and action.isCheckable():
-            name = action.data()
-            if name:
-                self.portfolio_manager.set_active_watchlist(name)
-                
-                # Update tabs
-                self.portfolio_tab.refresh_assets()
-                self.signals_tab.refresh_signals()
+        if self._active_watchlist_action is not None:
+            self._active_watchlist_action.setChecked(False)
+        if new_action is not None:
+            new_action.setChecked(True)
+        self._active_watchlist_action = new_action
+            
+    def _activate_watchlist(self, name: str, checked: bool = False):
+        """Activate a watchlist selected from the menu.
+        
+        Args:
+            name: Name of the selected watchlist
+            checked: Check state passed by the triggered signal (unused)
+        """
+        self.portfolio_manager.set_active_watchlist(name)
+        
+        # Update tabs
+        self.portfolio_tab.refresh_assets()
+        if self.signals_tab is not None:
+            self.signals_tab.refresh_signals()
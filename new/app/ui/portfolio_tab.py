@@ -2,25 +2,82 @@
 Portfolio tab for displaying and managing assets.
 """
 import logging
-from typing import Dict, List, Optional
+import time
+from functools import lru_cache, partial
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem, QTableView,
     QPushButton, QLabel, QComboBox, QHeaderView, QMenu, QAction,
-    QAbstractItemView, QInputDialog, QMessageBox, QSplitter, QFrame
+    QAbstractItemView, QInputDialog, QMessageBox, QSplitter, QFrame, QStyledItemDelegate
+)
+from PyQt5.QtCore import (
+    Qt, pyqtSlot, QTimer, QMetaObject, Q_ARG, QAbstractTableModel, QModelIndex, QSignalBlocker
 )
-from PyQt5.QtCore import Qt, pyqtSlot, QTimer
 from PyQt5.QtGui import QColor, QBrush, QFont, QIcon
 
 from app.services.binance_service import BinanceService
-from app.services.portfolio_manager import PortfolioManager
+from app.services.portfolio_manager import PortfolioManager, asset_arrays
 from app.services.strategy_manager import StrategyManager
 from app.models.asset import Asset, AssetPrice
+from app.models.strategy import Strategy
 from app.ui.theme import DarkThemeColors, apply_dark_theme_to_table, get_color_for_change
 
 
-class PortfolioTab(QWidget):
-    """Tab for portfolio management."""
+@lru_cache(maxsize=None)
+def _change_color(sign: int) -> QColor:
+    """Get the color for a price change direction.
+    
+    Args:
+        sign: -1, 0 or 1
+        
+    Returns:
+        The cached color
+    """
+    return get_color_for_change(sign)
+
+
+@lru_cache(maxsize=None)
+def _change_brush(sign: int) -> QBrush:
+    """Get the brush for a price change direction.
+    
+    Args:
+        sign: -1, 0 or 1
+        
+    Returns:
+        The cached brush
+    """
+    return QBrush(_change_color(sign))
+
+
+def format_asset_rows(assets: List[Asset]) -> List[Tuple[str, ...]]:
+    """Format the table text for a batch of assets.
+    
+    Args:
+        assets: Assets to format
+        
+    Returns:
+        One tuple of cell strings per asset, in column order
+    """
+    if not assets:
+        return []
+        
+    prices, changes, volumes, balances, values = asset_arrays(assets)
+    missing = np.isnan(prices)
+    return list(zip(
+        [a.display_name for a in assets],
+        np.where(missing, "N/A", np.char.mod("%.8f", prices)).tolist(),
+        np.where(missing, "N/A", np.char.mod("%.2f%%", changes * 100)).tolist(),
+        np.where(missing, "N/A", np.char.mod("%.2f", volumes)).tolist(),
+        np.char.mod("%.8f", balances).tolist(),
+        np.char.mod("%.2f", values).tolist(),
+    ))
+
+
+class AssetTableModel(QAbstractTableModel):
+    """Table model exposing a list of assets to a QTableView."""
     
     # Column indices
     COL_SYMBOL = 0
@@ -30,6 +87,318 @@ class PortfolioTab(QWidget):
     COL_BALANCE = 4
     COL_VALUE = 5
     
+    HEADERS = ["Symbol", "Price", "24h Change", "Volume", "Balance", "Value (USDT)"]
+    
+    # Rows formatted together when the view requests unformatted text
+    FORMAT_BATCH_SIZE = 50
+    
+    # Shared brushes, built once instead of per cell
+    _BRUSH_GREEN = QBrush(QColor(DarkThemeColors.SUCCESS))
+    _BRUSH_RED = QBrush(QColor(DarkThemeColors.ERROR))
+    _BRUSH_ALT_ROW = QBrush(QColor(DarkThemeColors.TABLE_ALTERNATE_ROW))
+    
+    def __init__(self, parent=None):
+        """Initialize the model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._assets: List[Asset] = []
+        self._watchlist_symbols: FrozenSet[str] = frozenset()
+        self._row_by_symbol: Dict[str, int] = {}
+        self._last_snapshot: Dict[str, Tuple] = {}
+        self._text: Dict[str, Tuple[str, ...]] = {}
+        
+    def set_assets(self, assets: List[Asset], watchlist_symbols: FrozenSet[str] = frozenset()):
+        """Replace the displayed assets.
+        
+        Rows are inserted, removed and refreshed incrementally when the new list
+        keeps the order of the rows already shown; otherwise the model is reset.
+        
+        Args:
+            assets: Assets to display
+            watchlist_symbols: Symbols of the active watchlist, highlighted in the table
+        """
+        self._watchlist_symbols = watchlist_symbols
+        new_symbols = [asset.symbol for asset in assets]
+        new_set = set(new_symbols)
+        kept = [symbol for symbol in new_symbols if symbol in self._row_by_symbol]
+        current_kept = [asset.symbol for asset in self._assets if asset.symbol in new_set]
+        
+        if (
+            len(new_set) != len(new_symbols)
+            or kept != current_kept
+            or new_symbols[:len(kept)] != kept
+        ):
+            self.beginResetModel()
+            self._assets = list(assets)
+            self._row_by_symbol = {symbol: row for row, symbol in enumerate(new_symbols)}
+            self._last_snapshot = {asset.symbol: self._snapshot(asset) for asset in assets}
+            self._text = {}
+            self.endResetModel()
+            return
+            
+        # Remove rows that are no longer shown, bottom-up so indices stay valid
+        removed_rows = sorted(
+            (row for symbol, row in self._row_by_symbol.items() if symbol not in new_set),
+            reverse=True
+        )
+        for row in removed_rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            symbol = self._assets.pop(row).symbol
+            self._last_snapshot.pop(symbol, None)
+            self._text.pop(symbol, None)
+            self.endRemoveRows()
+        if removed_rows:
+            self._row_by_symbol = {asset.symbol: row for row, asset in enumerate(self._assets)}
+            
+        # Refresh surviving rows whose displayed values changed
+        changed_rows = []
+        for row, asset in enumerate(assets[:len(kept)]):
+            self._assets[row] = asset
+            snapshot = self._snapshot(asset)
+            if self._last_snapshot.get(asset.symbol) != snapshot:
+                self._last_snapshot[asset.symbol] = snapshot
+                changed_rows.append(row)
+                
+        last_col = len(self.HEADERS) - 1
+        for row in changed_rows:
+            self._text.pop(self._assets[row].symbol, None)
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last_col))
+                
+        # Append new rows
+        added = assets[len(kept):]
+        if added:
+            first = len(self._assets)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for row, asset in enumerate(added, first):
+                self._assets.append(asset)
+                self._row_by_symbol[asset.symbol] = row
+                self._last_snapshot[asset.symbol] = self._snapshot(asset)
+            self.endInsertRows()
+            
+    def _format_batch(self, row: int) -> Tuple[str, ...]:
+        """Format the text of a row and its unformatted neighbours.
+        
+        Cell text is formatted lazily when the view first asks for it, so a
+        refresh only pays for the rows that are actually painted. Rows below
+        the requested one are formatted in the same batch since the view
+        paints them next.
+        
+        Args:
+            row: Row whose text is needed
+            
+        Returns:
+            The cell strings of the requested row
+        """
+        batch = [
+            asset for asset in self._assets[row:row + self.FORMAT_BATCH_SIZE]
+            if asset.symbol not in self._text
+        ]
+        for asset, text in zip(batch, format_asset_rows(batch)):
+            self._text[asset.symbol] = text
+        return self._text[self._assets[row].symbol]
+        
+    def _snapshot(self, asset: Asset) -> Tuple:
+        """Capture the values displayed for an asset.
+        
+        Args:
+            asset: The asset
+            
+        Returns:
+            Tuple that changes whenever the asset's row would render differently
+        """
+        price_data = asset.price_data
+        balance = asset.balance
+        in_watchlist = asset.symbol in self._watchlist_symbols
+        if price_data:
+            price = price_data.price
+            return (
+                asset.display_name, price, price_data.change_24h,
+                price_data.volume_24h, balance, balance * price, in_watchlist
+            )
+        return (asset.display_name, None, None, None, balance, 0.0, in_watchlist)
+        
+    def asset_at(self, row: int) -> Optional[Asset]:
+        """Get the asset displayed in a row.
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            The asset or None if the row is out of range
+        """
+        if 0 <= row < len(self._assets):
+            return self._assets[row]
+        return None
+        
+    def update_asset(self, asset: Asset) -> bool:
+        """Refresh the row showing an asset.
+        
+        Args:
+            asset: The updated asset
+            
+        Returns:
+            True if the asset is displayed, False otherwise
+        """
+        row = self._row_by_symbol.get(asset.symbol)
+        if row is None:
+            return False
+            
+        self._assets[row] = asset
+        self._last_snapshot[asset.symbol] = self._snapshot(asset)
+        self._text.pop(asset.symbol, None)
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, len(self.HEADERS) - 1)
+        )
+        return True
+        
+    def update_assets(self, assets: List[Asset]):
+        """Refresh the rows showing several assets with one dataChanged signal.
+        
+        The signal spans the rows between the first and last displayed asset.
+        
+        Args:
+            assets: The updated assets
+        """
+        rows = []
+        for asset in assets:
+            row = self._row_by_symbol.get(asset.symbol)
+            if row is None:
+                continue
+            self._assets[row] = asset
+            self._last_snapshot[asset.symbol] = self._snapshot(asset)
+            self._text.pop(asset.symbol, None)
+            rows.append(row)
+            
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), 0), self.index(max(rows), len(self.HEADERS) - 1)
+            )
+            
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._assets)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        asset = self._assets[index.row()]
+        col = index.column()
+        
+        if role == Qt.DisplayRole:
+            text = self._text.get(asset.symbol)
+            if text is None:
+                text = self._format_batch(index.row())
+            return text[col]
+        if role == Qt.ForegroundRole:
+            return self._foreground(asset, col)
+        if role == Qt.BackgroundRole:
+            return self._BRUSH_ALT_ROW if index.row() & 1 else None
+        if role == Qt.ToolTipRole and col == self.COL_SYMBOL:
+            if asset.is_long or asset.is_short:
+                return f"{asset.position_type} position with {asset.leverage}x leverage"
+            if asset.symbol in self._watchlist_symbols:
+                return "In watchlist"
+            return None
+        if role == Qt.UserRole:
+            # Keep the raw symbol for API operations
+            return asset.symbol
+        return None
+        
+    def _foreground(self, asset: Asset, col: int) -> Optional[QBrush]:
+        """Get the text brush for a cell."""
+        if col == self.COL_SYMBOL:
+            # Style based on position type for futures positions
+            is_long = asset.is_long
+            if is_long or asset.is_short:
+                return self._BRUSH_GREEN if is_long else self._BRUSH_RED
+            if asset.symbol in self._watchlist_symbols:
+                return self._BRUSH_GREEN
+        elif col == self.COL_CHANGE_24H:
+            price_data = asset.price_data
+            if price_data:
+                change = price_data.change_24h
+                return _change_brush((change > 0) - (change < 0))
+        return None
+
+
+class NumericAlignDelegate(QStyledItemDelegate):
+    """Delegate that right-aligns the numeric columns of the asset table."""
+    
+    NUMERIC_COLUMNS = frozenset((
+        AssetTableModel.COL_PRICE,
+        AssetTableModel.COL_CHANGE_24H,
+        AssetTableModel.COL_VOLUME,
+        AssetTableModel.COL_BALANCE,
+        AssetTableModel.COL_VALUE,
+    ))
+    
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.column() in self.NUMERIC_COLUMNS:
+            option.displayAlignment = Qt.AlignRight | Qt.AlignVCenter
+
+
+class PortfolioTab(QWidget):
+    """Tab for portfolio management."""
+    
+    # Column indices
+    COL_SYMBOL = AssetTableModel.COL_SYMBOL
+    COL_PRICE = AssetTableModel.COL_PRICE
+    COL_CHANGE_24H = AssetTableModel.COL_CHANGE_24H
+    COL_VOLUME = AssetTableModel.COL_VOLUME
+    COL_BALANCE = AssetTableModel.COL_BALANCE
+    COL_VALUE = AssetTableModel.COL_VALUE
+    
+    # Stylesheet for the tab's named widgets, compiled once per tab
+    _STYLE = f"""
+        QLabel#watchlistLabel {{
+            color: {DarkThemeColors.ACCENT};
+        }}
+        QLabel#filterLabel {{
+            color: {DarkThemeColors.TEXT_SECONDARY};
+        }}
+        QLabel#summaryLabel {{
+            color: {DarkThemeColors.ACCENT};
+            margin-bottom: 5px;
+        }}
+        QPushButton#futuresBtn {{
+            background-color: {DarkThemeColors.SUCCESS};
+            color: black;
+            font-weight: bold;
+        }}
+        QFrame#portfolioCard {{
+            background-color: {DarkThemeColors.CARD_BACKGROUND};
+            border-radius: 8px;
+            border: 1px solid {DarkThemeColors.BORDER};
+        }}
+        QSplitter::handle {{
+            background-color: {DarkThemeColors.BORDER};
+        }}
+    """
+    
+    # Refresh debounce bounds (ms) and futures positions cache lifetime (s)
+    REFRESH_BASE_INTERVAL = 150
+    REFRESH_MAX_INTERVAL = 2000
+    FUTURES_TTL = 15.0
+    
+    # Lifetime (s) of the strategy list cached for the context menu
+    STRATEGIES_TTL = 2.0
+    
+    # Summary change brushes
+    _BRUSH_POS_GREEN = QBrush(QColor(46, 204, 113))
+    _BRUSH_NEG_RED = QBrush(QColor(231, 76, 60))
+    
     def __init__(
         self, 
         binance_service: BinanceService, 
@@ -49,6 +418,21 @@ class PortfolioTab(QWidget):
         self.portfolio_manager = portfolio_manager
         self.strategy_manager = strategy_manager
         self.logger = logging.getLogger(__name__)
+        self._last_futures_update = 0.0
+        self._top_gainers_requests = 0
+        
+        # Context menu, built on first use
+        self._context_menu: Optional[QMenu] = None
+        self._context_symbol: Optional[str] = None
+        self._strategy_actions: Dict[str, QAction] = {}
+        self._strategies_cache: Optional[List[Strategy]] = None
+        self._strategies_cache_time = 0.0
+        
+        # Collapses bursts of refresh requests into one table rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_BASE_INTERVAL)
+        self._refresh_timer.timeout.connect(self._do_refresh_assets)
         
         # Setup UI
         self._setup_ui()
@@ -57,10 +441,13 @@ class PortfolioTab(QWidget):
         self._connect_signals()
         
         # Load initial data
-        self.refresh_assets()
+        self._do_refresh_assets()
         
     def _setup_ui(self):
         """Setup the user interface."""
+        # Style all named child widgets with one stylesheet
+        self.setStyleSheet(self._STYLE)
+        
         # Main layout
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
@@ -72,9 +459,10 @@ class PortfolioTab(QWidget):
         
         # Watchlist label with styling
         self.watchlist_label = QLabel("Active Watchlist: Default")
-        title_font = QFont("Segoe UI", 12, QFont.Bold)
-        self.watchlist_label.setFont(title_font)
-        self.watchlist_label.setStyleSheet(f"color: {DarkThemeColors.ACCENT};")
+        # Shared by the section titles; QFont needs the application to exist
+        self._title_font = QFont("Segoe UI", 12, QFont.Bold)
+        self.watchlist_label.setFont(self._title_font)
+        self.watchlist_label.setObjectName("watchlistLabel")
         header_layout.addWidget(self.watchlist_label)
         
         header_layout.addStretch()
@@ -82,11 +470,7 @@ class PortfolioTab(QWidget):
         # Futures positions button
         self.futures_btn = QPushButton("My Futures Positions")
         self.futures_btn.setMinimumHeight(32)
-        self.futures_btn.setStyleSheet(f"""
-            background-color: {DarkThemeColors.SUCCESS};
-            color: black;
-            font-weight: bold;
-        """)
+        self.futures_btn.setObjectName("futuresBtn")
         self.futures_btn.clicked.connect(self._show_futures_positions)
         header_layout.addWidget(self.futures_btn)
         
@@ -101,7 +485,7 @@ class PortfolioTab(QWidget):
         self.filter_combo.addItem("Futures Positions")
         
         filter_label = QLabel("Filter:")
-        filter_label.setStyleSheet(f"color: {DarkThemeColors.TEXT_SECONDARY};")
+        filter_label.setObjectName("filterLabel")
         header_layout.addWidget(filter_label)
         header_layout.addWidget(self.filter_combo)
         
@@ -118,13 +502,7 @@ class PortfolioTab(QWidget):
         # Create a card-like container for the tables
         container = QFrame()
         container.setFrameShape(QFrame.StyledPanel)
-        container.setStyleSheet(f"""
-            QFrame {{
-                background-color: {DarkThemeColors.CARD_BACKGROUND};
-                border-radius: 8px;
-                border: 1px solid {DarkThemeColors.BORDER};
-            }}
-        """)
+        container.setObjectName("portfolioCard")
         container_layout = QVBoxLayout(container)
         container_layout.setContentsMargins(15, 15, 15, 15)
         container_layout.setSpacing(15)
@@ -132,27 +510,27 @@ class PortfolioTab(QWidget):
         # Create splitter for tables
         splitter = QSplitter(Qt.Vertical)
         splitter.setHandleWidth(2)
-        splitter.setStyleSheet(f"""
-            QSplitter::handle {{
-                background-color: {DarkThemeColors.BORDER};
-            }}
-        """)
         container_layout.addWidget(splitter)
         
         # Assets table with styling
-        self.assets_table = QTableWidget()
-        self.assets_table.setColumnCount(6)
-        self.assets_table.setHorizontalHeaderLabels([
-            "Symbol", "Price", "24h Change", "Volume", "Balance", "Value (USDT)"
-        ])
+        self.assets_model = AssetTableModel(self)
+        self.assets_table = QTableView()
+        self.assets_table.setModel(self.assets_model)
+        self.assets_table.setItemDelegate(NumericAlignDelegate(self.assets_table))
         self.assets_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.assets_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.assets_table.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.assets_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Columns are sized once on first populate and rows have a fixed height
+        self.assets_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.assets_table.horizontalHeader().setStretchLastSection(True)
+        self.assets_table.verticalHeader().setDefaultSectionSize(24)
+        self.assets_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         self.assets_table.verticalHeader().setVisible(False)
-        self.assets_table.setAlternatingRowColors(True)
         # Apply dark theme to table
         apply_dark_theme_to_table(self.assets_table)
+        # Row alternation comes from the model's BackgroundRole
+        self.assets_table.setAlternatingRowColors(False)
+        self._columns_sized = False
         
         splitter.addWidget(self.assets_table)
         
@@ -162,9 +540,8 @@ class PortfolioTab(QWidget):
         summary_layout.setContentsMargins(0, 10, 0, 0)
         
         summary_label = QLabel("Portfolio Summary")
-        summary_font = QFont("Segoe UI", 12, QFont.Bold)
-        summary_label.setFont(summary_font)
-        summary_label.setStyleSheet(f"color: {DarkThemeColors.ACCENT}; margin-bottom: 5px;")
+        summary_label.setFont(self._title_font)
+        summary_label.setObjectName("summaryLabel")
         summary_layout.addWidget(summary_label)
         
         # Summary table with styling
@@ -175,6 +552,13 @@ class PortfolioTab(QWidget):
         self.summary_table.setItem(0, 0, QTableWidgetItem("Total Assets"))
         self.summary_table.setItem(1, 0, QTableWidgetItem("Total Value (USDT)"))
         self.summary_table.setItem(2, 0, QTableWidgetItem("24h Change"))
+        # Value cells are created once and updated in place
+        self._summary_count_item = QTableWidgetItem()
+        self._summary_value_item = QTableWidgetItem()
+        self._summary_change_item = QTableWidgetItem()
+        self.summary_table.setItem(0, 1, self._summary_count_item)
+        self.summary_table.setItem(1, 1, self._summary_value_item)
+        self.summary_table.setItem(2, 1, self._summary_change_item)
         self.summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         self.summary_table.verticalHeader().setVisible(False)
         self.summary_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
@@ -196,7 +580,9 @@ class PortfolioTab(QWidget):
         # Connect portfolio manager signals
         self.portfolio_manager.portfolio_updated.connect(self.refresh_assets)
         self.portfolio_manager.asset_updated.connect(self._update_asset_row)
+        self.portfolio_manager.assets_updated_batch.connect(self._update_asset_rows)
         self.portfolio_manager.watchlist_updated.connect(self._on_watchlist_updated)
+        self.portfolio_manager.top_gainers_ready.connect(self._on_top_gainers_ready)
         
         # Connect widget signals
         self.refresh_button.clicked.connect(self.refresh_assets)
@@ -205,184 +591,243 @@ class PortfolioTab(QWidget):
         
     def _show_futures_positions(self):
         """Show the futures positions in the table."""
-        # Set filter to Futures Positions
-        self.filter_combo.setCurrentIndex(5)  # Index for Futures Positions
+        # Set filter to Futures Positions without triggering a second refresh
+        if self.filter_combo.currentIndex() != 5:  # Index for Futures Positions
+            with QSignalBlocker(self.filter_combo):
+                self.filter_combo.setCurrentIndex(5)
+        self.refresh_assets()
+        
+    def _update_futures_positions_if_stale(self):
+        """Fetch futures positions unless they were fetched within the TTL.
+        
+        The fetch runs on the portfolio manager's thread; the table picks up
+        the result through the watchlist_updated and asset_updated signals.
+        """
+        now = time.monotonic()
+        if now - self._last_futures_update >= self.FUTURES_TTL:
+            self._last_futures_update = now
+            QMetaObject.invokeMethod(
+                self.portfolio_manager, "update_futures_positions", Qt.QueuedConnection
+            )
         
     def refresh_assets(self):
+        """Schedule a refresh of the assets table.
+        
+        Repeated calls within the debounce interval result in a single refresh.
+        The interval grows as the Binance request quota runs low.
+        """
+        headroom = self.binance_service.get_quota_headroom()
+        interval = int(self.REFRESH_BASE_INTERVAL * (1 + 5 * (1 - headroom) ** 2))
+        interval = min(interval, self.REFRESH_MAX_INTERVAL)
+        self._refresh_timer.setInterval(interval)
+        self._refresh_timer.start()
+        
+    def _do_refresh_assets(self):
         """Refresh the assets table with current data."""
         # Update watchlist label
         active_watchlist = self.portfolio_manager.get_active_watchlist()
+        watchlist_symbols = frozenset(active_watchlist.symbols)
         self.watchlist_label.setText(f"Active Watchlist: {active_watchlist.name}")
         
+        # Fetch the portfolio once and share it with the summary
+        all_assets = self.portfolio_manager.get_all_assets()
+        
         # Get assets based on filter
         filter_index = self.filter_combo.currentIndex()
         assets = []
         
         if filter_index == 0:  # All Assets
-            assets = self.portfolio_manager.get_all_assets()
+            assets = all_assets
         elif filter_index == 1:  # Watchlist Only
             assets = self.portfolio_manager.get_watchlist_assets()
         elif filter_index == 2:  # With Balance Only
-            assets = [a for a in self.portfolio_manager.get_all_assets() if a.balance > 0]
-        elif filter_index == 3:  # Top Gainers (24h)
-            assets = self.portfolio_manager.get_top_gainers(timeframe='24h', limit=20)
-        elif filter_index == 4:  # Top Gainers (4h)
-            assets = self.portfolio_manager.get_top_gainers(timeframe='4h', limit=20)
+            assets = self.portfolio_manager.get_assets_with_balance()
+        elif filter_index in (3, 4):  # Top Gainers (24h / 4h)
+            # Fetched on the portfolio manager's thread; the rows are shown
+            # when top_gainers_ready arrives
+            self._top_gainers_requests += 1
+            QMetaObject.invokeMethod(
+                self.portfolio_manager, "get_top_gainers", Qt.QueuedConnection,
+                Q_ARG(str, '24h' if filter_index == 3 else '4h'), Q_ARG(int, 20)
+            )
+            self._update_summary(all_assets)
+            return
         elif filter_index == 5:  # Futures Positions
             # Update futures positions before displaying
-            self.portfolio_manager.update_futures_positions()
+            self._update_futures_positions_if_stale()
             assets = self.portfolio_manager.get_watchlist_assets('futures_positions')
             
-        # Update table
-        self.assets_table.setRowCount(len(assets))
+        self._show_assets(assets, watchlist_symbols)
         
-        for row, asset in enumerate(assets):
-            self._update_asset_row(asset, row)
-            
         # Update summary
-        self._update_summary()
+        self._update_summary(all_assets)
         
-    def _update_asset_row(self, asset: Asset, row: Optional[int] = None):
-        """Update or add a row for an asset.
+    def _on_top_gainers_ready(self, assets: List[Asset]):
+        """Show the top gainers fetched by the portfolio manager.
         
         Args:
-            asset: The asset to update
-            row: Optional row index (searched if None)
+            assets: Top gaining assets
         """
-        # Find row if not provided
-        if row is None:
-            for i in range(self.assets_table.rowCount()):
-                if self.assets_table.item(i, self.COL_SYMBOL).text() == asset.symbol:
-                    row = i
-                    break
-                    
-            # Not found - may be filtered out
-            if row is None:
-                return
-        
-        # Get active watchlist for reference
-        active_watchlist = self.portfolio_manager.get_active_watchlist()
-                
-        # Create symbol item - store the actual symbol for API calls but display the formatted name
-        symbol_item = QTableWidgetItem(asset.display_name)
-        symbol_item.setData(Qt.UserRole, asset.symbol)  # Keep the raw symbol for API operations
-        
-        # Style based on position type for futures positions
-        if asset.is_long or asset.is_short:
-            position_color = DarkThemeColors.SUCCESS if asset.is_long else DarkThemeColors.ERROR
-            symbol_item.setForeground(QBrush(QColor(position_color)))
-            symbol_item.setToolTip(f"{asset.position_type} position with {asset.leverage}x leverage")
-        # Set watchlist indicator with color
-        elif active_watchlist.contains(asset.symbol):
-            symbol_item.setForeground(QBrush(QColor(DarkThemeColors.SUCCESS)))
-            symbol_item.setToolTip("In watchlist")
-        
-        self.assets_table.setItem(row, self.COL_SYMBOL, symbol_item)
-        
-        # Price data
-        if asset.price_data:
-            # Price
-            price_item = QTableWidgetItem(f"{asset.price_data.price:.8f}")
-            price_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.assets_table.setItem(row, self.COL_PRICE, price_item)
-            
-            # 24h Change with color
-            change_24h = asset.price_data.change_24h_percent
-            change_item = QTableWidgetItem(f"{change_24h:.2f}%")
-            change_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        # Results arrive in request order; only the latest one is shown
+        self._top_gainers_requests = max(0, self._top_gainers_requests - 1)
+        if self._top_gainers_requests or self.filter_combo.currentIndex() not in (3, 4):
+            return
             
-            # Apply color based on change value
-            change_item.setForeground(QBrush(get_color_for_change(change_24h)))
-            self.assets_table.setItem(row, self.COL_CHANGE_24H, change_item)
+        watchlist_symbols = frozenset(self.portfolio_manager.get_active_watchlist().symbols)
+        self._show_assets(assets, watchlist_symbols)
+        
+    def _show_assets(self, assets: List[Asset], watchlist_symbols: FrozenSet[str]):
+        """Show assets in the table.
+        
+        Args:
+            assets: Assets to display
+            watchlist_symbols: Symbols of the active watchlist
+        """
+        # Update table with painting and sorting suspended
+        was_sorted = self.assets_table.isSortingEnabled()
+        self.assets_table.setUpdatesEnabled(False)
+        self.assets_table.setSortingEnabled(False)
+        try:
+            self.assets_model.set_assets(assets, watchlist_symbols)
+        finally:
+            self.assets_table.setSortingEnabled(was_sorted)
+            self.assets_table.setUpdatesEnabled(True)
+            self.assets_table.viewport().update()
             
-            # Volume
-            volume_item = QTableWidgetItem(f"{asset.price_data.volume_24h:.2f}")
-            volume_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.assets_table.setItem(row, self.COL_VOLUME, volume_item)
-        else:
-            # No price data
-            self.assets_table.setItem(row, self.COL_PRICE, QTableWidgetItem("N/A"))
-            self.assets_table.setItem(row, self.COL_CHANGE_24H, QTableWidgetItem("N/A"))
-            self.assets_table.setItem(row, self.COL_VOLUME, QTableWidgetItem("N/A"))
+        if not self._columns_sized and assets:
+            self.assets_table.resizeColumnsToContents()
+            self._columns_sized = True
             
-        # Balance
-        balance_item = QTableWidgetItem(f"{asset.balance:.8f}")
-        balance_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.assets_table.setItem(row, self.COL_BALANCE, balance_item)
+    def _update_asset_row(self, asset: Asset):
+        """Refresh the row showing an asset.
+        
+        Args:
+            asset: The asset to update
+        """
+        # Ignored by the model if the asset is filtered out
+        self.assets_model.update_asset(asset)
+        
+    def _update_asset_rows(self, assets: List[Asset]):
+        """Update the rows for a batch of assets.
+        
+        Args:
+            assets: The assets to update
+        """
+        # Ignored by the model for assets that are filtered out
+        self.assets_model.update_assets(assets)
+        
+    def _update_summary(self, all_assets: List[Asset]):
+        """Update portfolio summary statistics.
         
-        # Value
-        value_item = QTableWidgetItem(f"{asset.value_usd:.2f}")
-        value_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.assets_table.setItem(row, self.COL_VALUE, value_item)
+        Args:
+            all_assets: All portfolio assets
+        """
+        arrays = asset_arrays(all_assets)
         
-    def _update_summary(self):
-        """Update portfolio summary statistics."""
-        assets = self.portfolio_manager.get_all_assets()
+        self.summary_table.setUpdatesEnabled(False)
+        try:
+            self._fill_summary(arrays)
+        finally:
+            self.summary_table.setUpdatesEnabled(True)
+            
+    def _fill_summary(self, arrays: Tuple[np.ndarray, ...]):
+        """Write the summary statistics into the summary table.
+        
+        Args:
+            arrays: Field arrays of all assets, as returned by asset_arrays()
+        """
+        _, changes, _, balances, values = arrays
         
         # Total assets with balance
-        assets_with_balance = sum(1 for asset in assets if asset.balance > 0)
-        self.summary_table.setItem(0, 1, QTableWidgetItem(str(assets_with_balance)))
+        assets_with_balance = int(np.count_nonzero(balances > 0))
+        self._summary_count_item.setText(str(assets_with_balance))
         
         # Total value
-        total_value = sum(asset.value_usd for asset in assets)
-        value_item = QTableWidgetItem(f"{total_value:.2f} USDT")
-        self.summary_table.setItem(1, 1, value_item)
+        total_value = float(values.sum())
+        self._summary_value_item.setText(f"{total_value:.2f} USDT")
         
         # 24h change
         # Calculate weighted change based on asset values
         if total_value > 0:
-            weighted_change = sum(
-                asset.price_data.change_24h * asset.value_usd / total_value
-                for asset in assets
-                if asset.price_data and asset.value_usd > 0
-            ) * 100
+            held_values = np.where(values > 0, values, 0.0)
+            weighted_change = float(np.dot(np.nan_to_num(changes), held_values) / total_value * 100)
         else:
             weighted_change = 0
             
-        change_item = QTableWidgetItem(f"{weighted_change:.2f}%")
+        change_item = self._summary_change_item
+        change_item.setText(f"{weighted_change:.2f}%")
         
         if weighted_change > 0:
-            change_item.setForeground(QBrush(QColor(46, 204, 113)))  # Green
+            change_item.setForeground(self._BRUSH_POS_GREEN)
         elif weighted_change < 0:
-            change_item.setForeground(QBrush(QColor(231, 76, 60)))  # Red
-            
-        self.summary_table.setItem(2, 1, change_item)
+            change_item.setForeground(self._BRUSH_NEG_RED)
+        else:
+            change_item.setData(Qt.ForegroundRole, None)
+        
+    def _build_context_menu(self):
+        """Create the asset context menu once; its contents are updated per show."""
+        self._context_menu = QMenu(self)
         
+        self._watchlist_action = QAction(self)
+        self._watchlist_action.triggered.connect(self._on_watchlist_action_triggered)
+        self._context_menu.addAction(self._watchlist_action)
+        
+        self._other_watchlists_menu = self._context_menu.addMenu("Add to Other Watchlist")
+        
+        self._context_menu.addSeparator()
+        
+        self._strategy_menu = self._context_menu.addMenu("Strategies")
+        
+    def _sync_strategy_actions(self):
+        """Rebuild the cached strategy actions if the available strategies changed."""
+        now = time.monotonic()
+        if self._strategies_cache is None or now - self._strategies_cache_time > self.STRATEGIES_TTL:
+            self._strategies_cache = self.strategy_manager.get_all_strategies()
+            self._strategies_cache_time = now
+            
+        strategies = self._strategies_cache
+        if [s.strategy_id for s in strategies] == list(self._strategy_actions):
+            return
+            
+        # Actions are owned by the menu, so clear() deletes the old ones
+        self._strategy_menu.clear()
+        self._strategy_actions = {}
+        for strategy in strategies:
+            strategy_action = QAction(strategy.name, self._strategy_menu)
+            strategy_action.setData(strategy.name)
+            strategy_action.triggered.connect(
+                partial(self._on_strategy_action_triggered, strategy.strategy_id)
+            )
+            self._strategy_menu.addAction(strategy_action)
+            self._strategy_actions[strategy.strategy_id] = strategy_action
+            
     def _show_context_menu(self, position):
         """Show context menu for asset table.
         
         Args:
             position: Position where menu should appear
         """
-        menu = QMenu()
-        
         # Get selected item
         selected_indexes = self.assets_table.selectedIndexes()
         if not selected_indexes:
             return
             
         # Get symbol from the selected row
-        row = selected_indexes[0].row()
-        symbol_item = self.assets_table.item(row, self.COL_SYMBOL)
-        if not symbol_item:
+        asset = self.assets_model.asset_at(selected_indexes[0].row())
+        if not asset:
             return
             
-        symbol = symbol_item.text()
+        if self._context_menu is None:
+            self._build_context_menu()
+            
+        symbol = self._context_symbol = asset.symbol
         active_watchlist = self.portfolio_manager.get_active_watchlist()
         
         # Add/remove from watchlist
         if active_watchlist.contains(symbol):
-            remove_action = QAction(f"Remove from {active_watchlist.name}", self)
-            remove_action.triggered.connect(
-                lambda: self._remove_from_watchlist(symbol)
-            )
-            menu.addAction(remove_action)
+            self._watchlist_action.setText(f"Remove from {active_watchlist.name}")
         else:
-            add_action = QAction(f"Add to {active_watchlist.name}", self)
-            add_action.triggered.connect(
-                lambda: self._add_to_watchlist(symbol)
-            )
-            menu.addAction(add_action)
+            self._watchlist_action.setText(f"Add to {active_watchlist.name}")
             
         # Add to other watchlists submenu
         other_watchlists = [
@@ -390,48 +835,63 @@ class PortfolioTab(QWidget):
             if name != active_watchlist.name
         ]
         
-        if other_watchlists:
-            other_menu = menu.addMenu("Add to Other Watchlist")
+        self._other_watchlists_menu.clear()
+        self._other_watchlists_menu.menuAction().setVisible(bool(other_watchlists))
+        for name in other_watchlists:
+            watchlist_action = self._other_watchlists_menu.addAction(name)
+            watchlist_action.triggered.connect(
+                partial(self._on_other_watchlist_triggered, name)
+            )
             
-            for name in other_watchlists:
-                watchlist_action = QAction(name, self)
-                watchlist_action.triggered.connect(
-                    lambda checked=False, n=name: self._add_to_watchlist(symbol, n)
-                )
-                other_menu.addAction(watchlist_action)
-                
-        menu.addSeparator()
-        
         # Strategy actions
-        strategy_menu = menu.addMenu("Strategies")
+        self._sync_strategy_actions()
         
         # Get assigned strategies
-        assigned_strategies = self.strategy_manager.get_asset_strategy_ids(symbol)
+        assigned_strategies = set(self.strategy_manager.get_asset_strategy_ids(symbol))
         
-        # Add strategies submenu
-        if assigned_strategies:
-            for strategy in self.strategy_manager.get_all_strategies():
-                strategy_action = QAction(strategy.name, self)
+        # Assigned strategies can be toggled; otherwise offer to assign one
+        for strategy_id, strategy_action in self._strategy_actions.items():
+            name = strategy_action.data()
+            if assigned_strategies:
+                strategy_action.setText(name)
                 strategy_action.setCheckable(True)
-                strategy_action.setChecked(strategy.strategy_id in assigned_strategies)
-                strategy_action.triggered.connect(
-                    lambda checked, s=strategy.strategy_id: 
-                    self._toggle_strategy(symbol, s, checked)
-                )
-                strategy_menu.addAction(strategy_action)
-        else:
-            # No strategies assigned
-            for strategy in self.strategy_manager.get_all_strategies():
-                strategy_action = QAction(f"Assign {strategy.name}", self)
-                strategy_action.triggered.connect(
-                    lambda checked=False, s=strategy.strategy_id: 
-                    self._assign_strategy(symbol, s)
-                )
-                strategy_menu.addAction(strategy_action)
+                strategy_action.setChecked(strategy_id in assigned_strategies)
+            else:
+                strategy_action.setText(f"Assign {name}")
+                strategy_action.setCheckable(False)
                 
         # Show menu
-        menu.exec_(self.assets_table.mapToGlobal(position))
+        self._context_menu.exec_(self.assets_table.mapToGlobal(position))
+        
+    def _on_watchlist_action_triggered(self):
+        """Add or remove the context menu symbol from the active watchlist."""
+        symbol = self._context_symbol
+        if self.portfolio_manager.get_active_watchlist().contains(symbol):
+            self._remove_from_watchlist(symbol)
+        else:
+            self._add_to_watchlist(symbol)
+            
+    def _on_other_watchlist_triggered(self, watchlist_name: str, checked: bool = False):
+        """Add the context menu symbol to another watchlist.
         
+        Args:
+            watchlist_name: Watchlist to add to
+            checked: Unused check state passed by the action
+        """
+        self._add_to_watchlist(self._context_symbol, watchlist_name)
+        
+    def _on_strategy_action_triggered(self, strategy_id: str, checked: bool = False):
+        """Handle a strategy action from the context menu.
+        
+        Args:
+            strategy_id: Strategy ID
+            checked: New check state of the action
+        """
+        if self._strategy_actions[strategy_id].isCheckable():
+            self._toggle_strategy(self._context_symbol, strategy_id, checked)
+        else:
+            self._assign_strategy(self._context_symbol, strategy_id)
+            
     def _add_to_watchlist(self, symbol: str, watchlist_name: Optional[str] = None):
         """Add a symbol to a watchlist.
         
@@ -457,7 +917,10 @@ class PortfolioTab(QWidget):
             symbol: Asset symbol
             strategy_id: Strategy ID
         """
-        self.strategy_manager.assign_strategy(symbol, strategy_id)
+        QMetaObject.invokeMethod(
+            self.strategy_manager, "assign_strategy", Qt.QueuedConnection,
+            Q_ARG(str, symbol), Q_ARG(str, strategy_id)
+        )
         
     def _remove_strategy(self, symbol: str, strategy_id: str):
         """Remove a strategy from an asset.
@@ -466,7 +929,10 @@ class PortfolioTab(QWidget):
             symbol: Asset symbol
             strategy_id: Strategy ID
         """
-        self.strategy_manager.remove_strategy(symbol, strategy_id)
+        QMetaObject.invokeMethod(
+            self.strategy_manager, "remove_strategy", Qt.QueuedConnection,
+            Q_ARG(str, symbol), Q_ARG(str, strategy_id)
+        )
         
     def _toggle_strategy(self, symbol: str, strategy_id: str, assign: bool):
         """Toggle a strategy assignment.
@@ -492,6 +958,8 @@ class PortfolioTab(QWidget):
         if active_watchlist.name == watchlist_name:
             self.watchlist_label.setText(f"Active Watchlist: {active_watchlist.name}")
             
-        # Refresh assets if we're showing watchlist only
-        if self.filter_combo.currentIndex() == 1:
+        # Refresh assets if we're showing watchlist only, or the futures
+        # positions after they changed
+        filter_index = self.filter_combo.currentIndex()
+        if filter_index == 1 or (filter_index == 5 and watchlist_name == 'futures_positions'):
             self.refresh_assets()
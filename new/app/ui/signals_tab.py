@@ -2,15 +2,19 @@
 Signals tab for displaying trading signals.
 """
 import logging
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QPushButton, QLabel, QComboBox, QHeaderView, QMenu, QAction,
     QAbstractItemView, QCheckBox, QFrame, QSplitter
 )
-from PyQt5.QtCore import Qt, pyqtSlot, QTimer
-from PyQt5.QtGui import QColor, QBrush, QFont, QIcon
+from PyQt5.QtCore import (
+    Qt, pyqtSlot, QTimer, QMetaObject, Q_ARG, QAbstractTableModel, QModelIndex
+)
+from PyQt5.QtGui import QColor, QBrush, QFont, QFontMetrics, QIcon
 
 from app.services.binance_service import BinanceService
 from app.services.portfolio_manager import PortfolioManager
@@ -19,6 +23,233 @@ from app.models.asset import Asset
 from app.models.strategy import Signal, SignalType, Strategy
 from app.ui.theme import DarkThemeColors, apply_dark_theme_to_table, get_color_for_change
 
+# Signal cell brushes, shared by every cell
+LONG_BRUSH = QBrush(QColor(46, 204, 113))  # Green
+SHORT_BRUSH = QBrush(QColor(231, 76, 60))  # Red
+NEUTRAL_BRUSH = QBrush(QColor(149, 165, 166))  # Gray
+
+# Signal type -> (text brush, bold)
+_SIGNAL_STYLE: Dict[SignalType, Tuple[QBrush, bool]] = {
+    SignalType.LONG: (LONG_BRUSH, True),
+    SignalType.SHORT: (SHORT_BRUSH, True),
+    SignalType.NEUTRAL: (NEUTRAL_BRUSH, False),
+}
+
+# Placeholder cell texts
+PENDING_TEXT = "..."  # Strategy assigned, no signal yet
+UNASSIGNED_TEXT = "-"  # Strategy not assigned
+
+# Roles answered by signal cells
+_SIGNAL_ROLES = frozenset((
+    Qt.DisplayRole, Qt.TextAlignmentRole, Qt.ForegroundRole, Qt.FontRole, Qt.ToolTipRole
+))
+
+
+@lru_cache(maxsize=4096)
+def _fmt_ts(ts: datetime) -> str:
+    """Format a signal timestamp for display.
+    
+    Args:
+        ts: Signal timestamp
+        
+    Returns:
+        The formatted timestamp
+    """
+    return ts.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _format_tooltip(signal: Signal) -> str:
+    """Build the tooltip with signal details.
+    
+    Args:
+        signal: The signal to describe
+        
+    Returns:
+        Multi-line tooltip text
+    """
+    lines = [
+        f"Signal: {signal.signal_type.value}",
+        f"Strength: {signal.strength:.2f}",
+        f"Generated: {_fmt_ts(signal.timestamp)}",
+    ]
+    
+    if signal.params:
+        lines.append("\nParameters:")
+        lines.extend(f"- {key}: {value}" for key, value in signal.params.items())
+        
+    return "\n".join(lines) + "\n"
+
+
+class SignalsModel(QAbstractTableModel):
+    """Table model with one row per symbol and one column per strategy."""
+    
+    def __init__(self, parent=None):
+        """Initialize the model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._symbols: List[str] = []
+        self._display_names: List[str] = []
+        self._strategies: List[Strategy] = []
+        self._assigned: List[FrozenSet[int]] = []
+        self._signals: Dict[Tuple[int, int], Signal] = {}
+        self._symbol_to_row: Dict[str, int] = {}
+        self._strategy_to_col: Dict[str, int] = {}
+        self._tooltips: Dict[Tuple[int, int], str] = {}
+        # Built per model since QFont needs the application to exist
+        self._bold_font = QFont("", -1, QFont.Bold)
+        
+    def set_contents(
+        self,
+        symbols: List[str],
+        display_names: List[str],
+        strategies: List[Strategy],
+        assigned: List[FrozenSet[int]],
+        signals: Dict[Tuple[int, int], Signal]
+    ):
+        """Replace the table contents.
+        
+        Args:
+            symbols: Clean symbols, one per row
+            display_names: Names shown in the symbol column
+            strategies: Strategies shown as columns after the symbol column
+            assigned: Columns of the strategies assigned to each row's symbol
+            signals: Latest signals keyed by (row, column)
+        """
+        self.beginResetModel()
+        self._symbols = symbols
+        self._display_names = display_names
+        self._strategies = strategies
+        self._assigned = assigned
+        self._signals = signals
+        self._tooltips = {}
+        self._symbol_to_row = {symbol: row for row, symbol in enumerate(symbols)}
+        self._strategy_to_col = {
+            strategy.strategy_id: col for col, strategy in enumerate(strategies, start=1)
+        }
+        self.endResetModel()
+        
+    def update_signals(self, signals: Dict[Tuple[int, int], Signal]):
+        """Update signal cells without changing rows or columns.
+        
+        Only cells whose signal type or timestamp changed are repainted.
+        
+        Args:
+            signals: Latest signals keyed by (row, column)
+        """
+        old_signals = self._signals
+        self._signals = signals
+        
+        for key in old_signals.keys() | signals.keys():
+            old = old_signals.get(key)
+            new = signals.get(key)
+            if old is new:
+                continue
+            if (
+                old is not None and new is not None
+                and old.signal_type == new.signal_type
+                and old.timestamp == new.timestamp
+            ):
+                continue
+            self._tooltips.pop(key, None)
+            index = self.index(*key)
+            self.dataChanged.emit(index, index)
+            
+    def symbol_at(self, row: int) -> Optional[str]:
+        """Get the clean symbol shown in a row.
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            The symbol or None if the row is out of range
+        """
+        if 0 <= row < len(self._symbols):
+            return self._symbols[row]
+        return None
+        
+    def update_signal(self, signal: Signal) -> bool:
+        """Show a new signal if its cell is in the table.
+        
+        Args:
+            signal: The new signal
+            
+        Returns:
+            True if the cell was updated, False otherwise
+        """
+        row = self._symbol_to_row.get(signal.symbol, -1)
+        if row == -1:
+            # Symbol not in table
+            return False
+            
+        col = self._strategy_to_col.get(signal.strategy_id, -1)
+        if col == -1:
+            # Strategy not in table
+            return False
+            
+        self._signals[(row, col)] = signal
+        self._tooltips.pop((row, col), None)
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index)
+        return True
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._symbols)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1 + len(self._strategies)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            # First column is symbol, rest are strategies
+            return "Symbol" if section == 0 else self._strategies[section - 1].name
+        return None
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        row = index.row()
+        col = index.column()
+        
+        if col == 0:
+            if role == Qt.DisplayRole:
+                return self._display_names[row]
+            if role == Qt.UserRole:
+                # Clean symbol for API operations
+                return self._symbols[row]
+            return None
+            
+        # The view asks for many roles per cell; skip the lookup for unused ones
+        if role not in _SIGNAL_ROLES:
+            return None
+            
+        signal = self._signals.get((row, col))
+        if signal is None:
+            if role == Qt.DisplayRole:
+                assigned = col in self._assigned[row]
+                # No signal yet, or strategy not assigned
+                return PENDING_TEXT if assigned else UNASSIGNED_TEXT
+            return None
+            
+        if role == Qt.DisplayRole:
+            return signal.signal_type.value
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        if role == Qt.ForegroundRole:
+            return _SIGNAL_STYLE[signal.signal_type][0]
+        if role == Qt.FontRole:
+            return self._bold_font if _SIGNAL_STYLE[signal.signal_type][1] else None
+        if role == Qt.ToolTipRole:
+            # Built on first hover and kept until the cell's signal changes
+            tooltip = self._tooltips.get((row, col))
+            if tooltip is None:
+                tooltip = self._tooltips[(row, col)] = _format_tooltip(signal)
+            return tooltip
+        return None
+
 
 class SignalsTab(QWidget):
     """Tab for signal dashboard."""
@@ -46,6 +277,18 @@ class SignalsTab(QWidget):
         # Keep track of active strategies (columns)
         self.active_strategies: List[Strategy] = []
         
+        # Strategy IDs per symbol from the last refresh
+        self._asset_strategy_map: Dict[str, FrozenSet[str]] = {}
+        self._last_active_ids: Optional[List[str]] = None
+        self._last_structure: Optional[Tuple] = None
+        self._watchlist_source_active = True  # Source combo starts on Active Watchlist
+        
+        # Collapses bursts of refresh requests into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
         # Setup UI
         self._setup_ui()
         
@@ -53,7 +296,7 @@ class SignalsTab(QWidget):
         self._connect_signals()
         
         # Load initial data
-        self.refresh_signals()
+        self._do_refresh()
         
     def _setup_ui(self):
         """Setup the user interface."""
@@ -114,193 +357,181 @@ class SignalsTab(QWidget):
         main_layout.addLayout(legend_layout)
         
         # Signals table
-        self.signals_table = QTableWidget()
+        self.signals_model = SignalsModel(self)
+        self.signals_table = QTableView()
+        self.signals_table.setModel(self.signals_model)
         self.signals_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.signals_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.signals_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.signals_table.verticalHeader().setVisible(False)
+        self.signals_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         main_layout.addWidget(self.signals_table)
         
     def _connect_signals(self):
         """Connect signals from services and widgets."""
         # Connect strategy manager signals
         self.strategy_manager.signal_generated.connect(self._on_signal_generated)
-        self.strategy_manager.strategy_assigned.connect(
-            lambda symbol, strategy_id: self.refresh_signals()
-        )
-        self.strategy_manager.strategy_removed.connect(
-            lambda symbol, strategy_id: self.refresh_signals()
-        )
+        self.strategy_manager.strategy_assigned.connect(self._on_strategy_changed)
+        self.strategy_manager.strategy_removed.connect(self._on_strategy_changed)
+        self.strategy_manager.strategies_cleared.connect(self._on_strategies_cleared)
         
         # Connect portfolio manager signals
         self.portfolio_manager.portfolio_updated.connect(self.refresh_signals)
-        self.portfolio_manager.watchlist_updated.connect(
-            lambda name: self.refresh_signals() 
-            if self.source_combo.currentIndex() == 0 else None
-        )
+        self.portfolio_manager.watchlist_updated.connect(self._on_watchlist_updated)
         
         # Connect widget signals
         self.refresh_button.clicked.connect(self.refresh_signals)
-        self.source_combo.currentIndexChanged.connect(self.refresh_signals)
+        self.source_combo.currentIndexChanged.connect(self._on_source_changed)
         self.auto_refresh_check.stateChanged.connect(self._toggle_auto_refresh)
         self.signals_table.customContextMenuRequested.connect(self._show_context_menu)
         
+    @pyqtSlot(str, str)
+    def _on_strategy_changed(self, symbol: str, strategy_id: str):
+        """Refresh after a strategy assignment changed.
+        
+        Args:
+            symbol: Asset symbol
+            strategy_id: Strategy ID
+        """
+        self.refresh_signals()
+        
+    @pyqtSlot(str)
+    def _on_strategies_cleared(self, symbol: str):
+        """Refresh after all strategies were removed from an asset.
+        
+        Args:
+            symbol: Asset symbol
+        """
+        self.refresh_signals()
+        
+    @pyqtSlot(str)
+    def _on_watchlist_updated(self, watchlist_name: str):
+        """Refresh when showing the active watchlist.
+        
+        Args:
+            watchlist_name: Name of the updated watchlist
+        """
+        if self._watchlist_source_active:
+            self.refresh_signals()
+            
+    @pyqtSlot(int)
+    def _on_source_changed(self, index: int):
+        """Track the selected asset source and refresh.
+        
+        Args:
+            index: Selected source index
+        """
+        self._watchlist_source_active = index == 0
+        self.refresh_signals()
+        
     def refresh_signals(self):
+        """Schedule a refresh of the signals table.
+        
+        Repeated calls within the debounce interval result in a single refresh.
+        """
+        self._refresh_timer.start()
+        
+    def _do_refresh(self):
         """Refresh the signals table with current data."""
         # Get assets based on source
         source_index = self.source_combo.currentIndex()
         symbols = []
-        assets_map = {}  # Map of base_symbol -> asset for lookups
-        
-        if source_index == 0:  # Active Watchlist
-            assets = self.portfolio_manager.get_watchlist_assets()
-            # Store clean symbols for API operations but keep a map to assets for display
-            for asset in assets:
-                symbols.append(asset.base_symbol)
-                assets_map[asset.base_symbol] = asset
-        elif source_index == 1:  # Portfolio Assets
-            assets = [a for a in self.portfolio_manager.get_all_assets() if a.balance > 0]
-            # Store clean symbols for API operations but keep a map to assets for display
-            for asset in assets:
-                symbols.append(asset.base_symbol)
-                assets_map[asset.base_symbol] = asset
+        display_names = []
+        
+        if source_index in (0, 1):
+            if source_index == 0:  # Active Watchlist
+                assets = self.portfolio_manager.get_watchlist_assets()
+            else:  # Portfolio Assets
+                assets = self.portfolio_manager.get_assets_with_balance()
+            # Clean symbols for API operations, formatted names for display
+            pairs = [(asset.base_symbol, asset.display_name) for asset in assets]
+            if pairs:
+                symbols, display_names = (list(column) for column in zip(*pairs))
         elif source_index == 2:  # Assets with Strategies
-            symbols = self.strategy_manager.get_assets_with_strategies()
+            symbols = list(self.strategy_manager.get_assets_with_strategies())
+            display_names = symbols
             
         # Get all strategies
         all_strategies = self.strategy_manager.get_all_strategies()
         
+        # Fetch each symbol's strategies once for the whole refresh
+        asset_strategy_map = {
+            symbol: frozenset(self.strategy_manager.get_asset_strategy_ids(symbol))
+            for symbol in symbols
+        }
+        self._asset_strategy_map = asset_strategy_map
+        
         # Filter for active strategies (those assigned to at least one asset)
-        active_strategy_ids = set()
-        for symbol in symbols:
-            active_strategy_ids.update(
-                self.strategy_manager.get_asset_strategy_ids(symbol)
-            )
-            
+        active_strategy_ids = frozenset().union(*asset_strategy_map.values())
+        
         self.active_strategies = [
             strategy for strategy in all_strategies 
             if strategy.strategy_id in active_strategy_ids
         ]
         
-        # Configure table columns
-        # First column is symbol, rest are strategies
-        self.signals_table.setColumnCount(1 + len(self.active_strategies))
-        
-        headers = ["Symbol"]
-        for strategy in self.active_strategies:
-            headers.append(strategy.name)
-            
-        self.signals_table.setHorizontalHeaderLabels(headers)
-        
-        # Update table rows
-        self.signals_table.setRowCount(len(symbols))
+        # Collect assigned columns and current signals per row
+        active_ids = [strategy.strategy_id for strategy in self.active_strategies]
+        assigned = []
+        signals = {}
+        signals_bulk = self.strategy_manager.get_signals_bulk(symbols, active_ids)
         
         for row, symbol in enumerate(symbols):
-            # Set symbol - display the formatted name but store the base symbol for API calls
-            display_text = symbol
-            if symbol in assets_map:
-                display_text = assets_map[symbol].display_name
-                
-            symbol_item = QTableWidgetItem(display_text)
-            symbol_item.setData(Qt.UserRole, symbol)  # Store clean symbol for API operations
-            self.signals_table.setItem(row, 0, symbol_item)
-            
-            # Get asset strategies
-            asset_strategy_ids = self.strategy_manager.get_asset_strategy_ids(symbol)
+            # Columns of the strategies assigned to this asset
+            row_ids = asset_strategy_map[symbol]
+            assigned_cols = [
+                col for col, sid in enumerate(active_ids, start=1) if sid in row_ids
+            ]
+            assigned.append(frozenset(assigned_cols))
             
-            # Set signal cells
-            for col, strategy in enumerate(self.active_strategies, start=1):
-                if strategy.strategy_id in asset_strategy_ids:
-                    # Get signal
-                    signal = self.strategy_manager.get_signal(symbol, strategy.strategy_id)
-                    
-                    if signal:
-                        self._set_signal_cell(row, col, signal)
-                    else:
-                        # No signal yet
-                        self.signals_table.setItem(row, col, QTableWidgetItem("..."))
-                else:
-                    # Strategy not assigned
-                    self.signals_table.setItem(row, col, QTableWidgetItem("-"))
-                    
-        # Resize columns
-        self.signals_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        for col in range(1, self.signals_table.columnCount()):
-            self.signals_table.horizontalHeader().setSectionResizeMode(
-                col, QHeaderView.ResizeToContents
+            for col in assigned_cols:
+                signal = signals_bulk.get((symbol, active_ids[col - 1]))
+                if signal:
+                    signals[(row, col)] = signal
+                        
+        # Fast path: same rows and columns, so only changed signal cells need updating
+        structure = (symbols, display_names, active_ids, assigned)
+        if structure == self._last_structure:
+            self.signals_model.update_signals(signals)
+            return
+        self._last_structure = structure
+        
+        # Swap in the new contents with painting and sorting suspended
+        was_sorted = self.signals_table.isSortingEnabled()
+        self.signals_table.setUpdatesEnabled(False)
+        self.signals_table.setSortingEnabled(False)
+        try:
+            self.signals_model.set_contents(
+                symbols, display_names, self.active_strategies, assigned, signals
             )
             
-    def _set_signal_cell(self, row: int, col: int, signal: Signal):
-        """Set the cell content for a signal.
-        
-        Args:
-            row: Table row
-            col: Table column
-            signal: The signal to display
-        """
-        # Create item with signal type
-        item = QTableWidgetItem(signal.signal_type.value)
-        item.setTextAlignment(Qt.AlignCenter)
-        
-        # Set color based on signal type
-        if signal.signal_type == SignalType.LONG:
-            item.setForeground(QBrush(QColor(46, 204, 113)))  # Green
-            item.setFont(QFont("", -1, QFont.Bold))
-        elif signal.signal_type == SignalType.SHORT:
-            item.setForeground(QBrush(QColor(231, 76, 60)))  # Red
-            item.setFont(QFont("", -1, QFont.Bold))
-        else:  # NEUTRAL
-            item.setForeground(QBrush(QColor(149, 165, 166)))  # Gray
+            # Size strategy columns from their header text, only when they changed
+            if active_ids != self._last_active_ids:
+                self._last_active_ids = active_ids
+                self._size_strategy_columns()
+        finally:
+            self.signals_table.setSortingEnabled(was_sorted)
+            self.signals_table.setUpdatesEnabled(True)
+            self.signals_table.viewport().update()
+            
+    def _size_strategy_columns(self):
+        """Set strategy column widths from the header and signal label widths."""
+        header = self.signals_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        
+        metrics = QFontMetrics(header.font())
+        # Wide enough for the longest signal label as well as the strategy name
+        min_width = metrics.horizontalAdvance(SignalType.NEUTRAL.value)
+        for col, strategy in enumerate(self.active_strategies, start=1):
+            width = max(metrics.horizontalAdvance(strategy.name), min_width) + 24
+            header.resizeSection(col, width)
             
-        # Add tooltip with signal details
-        tooltip = f"Signal: {signal.signal_type.value}\n"
-        tooltip += f"Strength: {signal.strength:.2f}\n"
-        tooltip += f"Generated: {signal.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n"
-        
-        if signal.params:
-            tooltip += "\nParameters:\n"
-            for key, value in signal.params.items():
-                tooltip += f"- {key}: {value}\n"
-                
-        item.setToolTip(tooltip)
-        
-        # Set the item
-        self.signals_table.setItem(row, col, item)
-        
     def _on_signal_generated(self, signal: Signal):
         """Handle new signal from strategy manager.
         
         Args:
             signal: The new signal
         """
-        # Find row for symbol
-        symbol = signal.symbol
-        row = -1
-        
-        for r in range(self.signals_table.rowCount()):
-            if self.signals_table.item(r, 0).text() == symbol:
-                row = r
-                break
-                
-        if row == -1:
-            # Symbol not in table
-            return
-            
-        # Find column for strategy
-        strategy_id = signal.strategy_id
-        col = -1
-        
-        for c, strategy in enumerate(self.active_strategies, start=1):
-            if strategy.strategy_id == strategy_id:
-                col = c
-                break
-                
-        if col == -1:
-            # Strategy not in table
-            return
-            
-        # Update the cell
-        self._set_signal_cell(row, col, signal)
+        self.signals_model.update_signal(signal)
         
     def _toggle_auto_refresh(self, state):
         """Toggle auto-refresh of signals.
@@ -308,10 +539,9 @@ class SignalsTab(QWidget):
         Args:
             state: Checkbox state
         """
-        if state == Qt.Checked:
-            self.strategy_manager.start_auto_refresh()
-        else:
-            self.strategy_manager.stop_auto_refresh()
+        # The refresh timer lives on the strategy manager's thread
+        method = "start_auto_refresh" if state == Qt.Checked else "stop_auto_refresh"
+        QMetaObject.invokeMethod(self.strategy_manager, method, Qt.QueuedConnection)
             
     def _show_context_menu(self, position):
         """Show context menu for signal table.
@@ -327,12 +557,9 @@ class SignalsTab(QWidget):
             return
             
         # Get symbol from the selected row
-        row = selected_indexes[0].row()
-        symbol_item = self.signals_table.item(row, 0)
-        if not symbol_item:
+        symbol = self.signals_model.symbol_at(selected_indexes[0].row())
+        if not symbol:
             return
-            
-        symbol = symbol_item.text()
         
         # Refresh signals action
         refresh_action = QAction(f"Refresh Signals for {symbol}", self)
@@ -346,30 +573,55 @@ class SignalsTab(QWidget):
         # Strategy management submenu
         strategy_menu = menu.addMenu("Strategies")
         
-        # Get assigned strategies
-        assigned_strategies = self.strategy_manager.get_asset_strategy_ids(symbol)
+        # Get assigned strategies, reusing the last refresh's lookup when possible
+        assigned_strategies = self._asset_strategy_map.get(symbol)
+        if assigned_strategies is None:
+            assigned_strategies = frozenset(self.strategy_manager.get_asset_strategy_ids(symbol))
         
         # Add strategies
-        for strategy in self.strategy_manager.get_all_strategies():
-            strategy_action = QAction(strategy.name, self)
-            strategy_action.setCheckable(True)
-            strategy_action.setChecked(strategy.strategy_id in assigned_strategies)
-            strategy_action.triggered.connect(
-                lambda checked, s=strategy.strategy_id: 
-                self._toggle_strategy(symbol, s, checked)
+        strategy_menu.addActions([
+            self._make_strategy_action(
+                strategy_menu, symbol, strategy, strategy.strategy_id in assigned_strategies
             )
-            strategy_menu.addAction(strategy_action)
-            
+            for strategy in self.strategy_manager.get_all_strategies()
+        ])
+        
         # Show menu
         menu.exec_(self.signals_table.mapToGlobal(position))
         
+    def _make_strategy_action(
+        self, menu: QMenu, symbol: str, strategy: Strategy, assigned: bool
+    ) -> QAction:
+        """Create a checkable action toggling a strategy for a symbol.
+        
+        Args:
+            menu: Menu owning the action
+            symbol: Asset symbol
+            strategy: Strategy toggled by the action
+            assigned: Whether the strategy is currently assigned
+            
+        Returns:
+            QAction: The new action
+        """
+        strategy_action = QAction(strategy.name, menu)
+        strategy_action.setCheckable(True)
+        strategy_action.setChecked(assigned)
+        strategy_action.triggered.connect(
+            lambda checked, s=strategy.strategy_id:
+            self._toggle_strategy(symbol, s, checked)
+        )
+        return strategy_action
+        
     def _refresh_asset_signals(self, symbol: str):
         """Refresh signals for a specific asset.
         
         Args:
             symbol: Asset symbol
         """
-        self.strategy_manager.refresh_asset_signals(symbol)
+        QMetaObject.invokeMethod(
+            self.strategy_manager, "refresh_asset_signals", Qt.QueuedConnection,
+            Q_ARG(str, symbol)
+        )
         
     def _toggle_strategy(self, symbol: str, strategy_id: str, assign: bool):
         """Toggle a strategy assignment.
@@ -379,7 +631,8 @@ class SignalsTab(QWidget):
             strategy_id: Strategy ID
             assign: Whether to assign or remove
         """
-        if assign:
-            self.strategy_manager.assign_strategy(symbol, strategy_id)
-        else:
-            self.strategy_manager.remove_strategy(symbol, strategy_id)
+        method = "assign_strategy" if assign else "remove_strategy"
+        QMetaObject.invokeMethod(
+            self.strategy_manager, method, Qt.QueuedConnection,
+            Q_ARG(str, symbol), Q_ARG(str, strategy_id)
+        )
@@ -2,16 +2,19 @@
 Strategies tab for configuring trading strategies.
 """
 import logging
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QPushButton, QLabel, QComboBox, QHeaderView, QMenu, QAction,
     QAbstractItemView, QDialog, QDialogButtonBox, QFormLayout,
     QLineEdit, QSpinBox, QDoubleSpinBox, QGroupBox, QListWidget,
     QListWidgetItem, QSplitter, QGridLayout, QScrollArea, QFrame
 )
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import (
+    Qt, pyqtSlot, QTimer, QMetaObject, Q_ARG, QAbstractTableModel, QModelIndex
+)
 from PyQt5.QtGui import QColor, QBrush, QFont, QIcon
 
 from app.services.binance_service import BinanceService
@@ -21,6 +24,66 @@ from app.models.strategy import Strategy
 from app.ui.theme import DarkThemeColors, apply_dark_theme_to_table, get_color_for_change
 
 
+def _make_int_widget(value: int) -> QSpinBox:
+    """Create the editor for an integer parameter."""
+    spin_box = QSpinBox()
+    spin_box.setMinimum(1)
+    spin_box.setMaximum(1000)
+    spin_box.setValue(value)
+    return spin_box
+
+
+def _make_float_widget(value: float) -> QDoubleSpinBox:
+    """Create the editor for a float parameter."""
+    double_spin = QDoubleSpinBox()
+    double_spin.setMinimum(0.0)
+    double_spin.setMaximum(100.0)
+    double_spin.setSingleStep(0.1)
+    double_spin.setValue(value)
+    return double_spin
+
+
+def _make_str_widget(value) -> QLineEdit:
+    """Create the editor for a string (or any other) parameter."""
+    return QLineEdit(str(value))
+
+
+# Parameter type -> editor factory; other types are edited as strings
+_WIDGET_FACTORY = {
+    int: _make_int_widget,
+    bool: _make_int_widget,  # bool is an int, edited as before
+    float: _make_float_widget,
+    str: _make_str_widget,
+}
+
+# Editor type -> value getter
+_VALUE_GETTER = {
+    QSpinBox: QSpinBox.value,
+    QDoubleSpinBox: QDoubleSpinBox.value,
+    QLineEdit: QLineEdit.text,
+}
+
+
+def _fill_combo(combo: QComboBox, texts: List[str], values: List[str]):
+    """Add items to a combo box in one batch.
+    
+    Args:
+        combo: Combo box to fill
+        texts: Item texts
+        values: User data for each item
+    """
+    combo.addItems(texts)
+    
+    # Attach the user data without notifying per item
+    model = combo.model()
+    blocked = model.blockSignals(True)
+    try:
+        for i, value in enumerate(values):
+            combo.setItemData(i, value)
+    finally:
+        model.blockSignals(blocked)
+
+
 class StrategyConfigDialog(QDialog):
     """Dialog for configuring strategy parameters."""
     
@@ -55,29 +118,11 @@ class StrategyConfigDialog(QDialog):
         form_layout = QFormLayout()
         
         for param_name, param_value in strategy.parameters.items():
-            if isinstance(param_value, int):
-                # Integer parameter
-                spin_box = QSpinBox()
-                spin_box.setMinimum(1)
-                spin_box.setMaximum(1000)
-                spin_box.setValue(param_value)
-                form_layout.addRow(param_name, spin_box)
-                self.parameter_widgets[param_name] = spin_box
-            elif isinstance(param_value, float):
-                # Float parameter
-                double_spin = QDoubleSpinBox()
-                double_spin.setMinimum(0.0)
-                double_spin.setMaximum(100.0)
-                double_spin.setSingleStep(0.1)
-                double_spin.setValue(param_value)
-                form_layout.addRow(param_name, double_spin)
-                self.parameter_widgets[param_name] = double_spin
-            else:
-                # String parameter
-                line_edit = QLineEdit(str(param_value))
-                form_layout.addRow(param_name, line_edit)
-                self.parameter_widgets[param_name] = line_edit
-                
+            factory = _WIDGET_FACTORY.get(type(param_value), _make_str_widget)
+            widget = factory(param_value)
+            form_layout.addRow(param_name, widget)
+            self.parameter_widgets[param_name] = widget
+            
         layout.addLayout(form_layout)
         
         # Add buttons
@@ -96,20 +141,193 @@ class StrategyConfigDialog(QDialog):
         Returns:
             Dict: Parameter name -> value mapping
         """
-        result = {}
-        
-        for param_name, widget in self.parameter_widgets.items():
-            if isinstance(widget, QSpinBox) or isinstance(widget, QDoubleSpinBox):
-                result[param_name] = widget.value()
-            else:
-                result[param_name] = widget.text()
-                
-        return result
+        return {
+            param_name: _VALUE_GETTER[type(widget)](widget)
+            for param_name, widget in self.parameter_widgets.items()
+        }
+
+
+class StrategyTableModel(QAbstractTableModel):
+    """Table model listing the available strategies."""
+    
+    HEADERS = ["Strategy", "Description"]
+    
+    def __init__(self, parent=None):
+        """Initialize the model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._rows: List[Strategy] = []
+        
+    def set_strategies(self, strategies: List[Strategy]):
+        """Replace the listed strategies.
+        
+        Args:
+            strategies: Strategies to show, one per row
+        """
+        self.beginResetModel()
+        self._rows = strategies
+        self.endResetModel()
+        
+    def strategy_at(self, row: int) -> Optional[Strategy]:
+        """Get the strategy shown in a row.
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            The strategy or None if the row is out of range
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        strategy = self._rows[index.row()]
+        
+        if role == Qt.DisplayRole:
+            return strategy.name if index.column() == 0 else strategy.description
+        if role == Qt.UserRole:
+            return strategy.strategy_id
+        return None
+
+
+class AssignmentModel(QAbstractTableModel):
+    """Table model listing assets and their assigned strategies."""
+    
+    HEADERS = ["Asset", "Assigned Strategies"]
+    
+    # Row tuple field shown in each column
+    _DISPLAY_FIELDS = (0, 2)
+    
+    def __init__(self, parent=None):
+        """Initialize the model.
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        # (display text, base symbol, joined strategy names)
+        self._rows: List[Tuple[str, str, str]] = []
+        self._row_by_symbol: Dict[str, int] = {}
+        
+    def set_rows(self, rows: List[Tuple[str, str, str]]):
+        """Replace the listed assignments.
+        
+        Rows are inserted, removed and refreshed incrementally when the new list
+        keeps the order of the rows already shown; otherwise the model is reset.
+        
+        Args:
+            rows: (display text, base symbol, joined strategy names) per asset
+        """
+        new_symbols = [row[1] for row in rows]
+        new_set = set(new_symbols)
+        kept = [symbol for symbol in new_symbols if symbol in self._row_by_symbol]
+        current_kept = [row[1] for row in self._rows if row[1] in new_set]
+        
+        if (
+            len(new_set) != len(new_symbols)
+            or kept != current_kept
+            or new_symbols[:len(kept)] != kept
+        ):
+            self.beginResetModel()
+            self._rows = list(rows)
+            self._row_by_symbol = {symbol: row for row, symbol in enumerate(new_symbols)}
+            self.endResetModel()
+            return
+            
+        # Remove rows that are no longer shown, bottom-up so indices stay valid
+        removed_rows = sorted(
+            (row for symbol, row in self._row_by_symbol.items() if symbol not in new_set),
+            reverse=True
+        )
+        for row in removed_rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+        if removed_rows:
+            self._row_by_symbol = {values[1]: row for row, values in enumerate(self._rows)}
+            
+        # Refresh only the cells whose text changed
+        for row, values in enumerate(rows[:len(kept)]):
+            old = self._rows[row]
+            if old == values:
+                continue
+            self._rows[row] = values
+            for col, text_index in enumerate(self._DISPLAY_FIELDS):
+                if old[text_index] != values[text_index]:
+                    index = self.index(row, col)
+                    self.dataChanged.emit(index, index, [Qt.DisplayRole])
+                    
+        # Append new rows
+        added = rows[len(kept):]
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for row, values in enumerate(added, first):
+                self._rows.append(values)
+                self._row_by_symbol[values[1]] = row
+            self.endInsertRows()
+        
+    def symbol_at(self, row: int) -> Optional[str]:
+        """Get the base symbol shown in a row.
+        
+        Args:
+            row: Row index
+            
+        Returns:
+            The base symbol or None if the row is out of range
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row][1]
+        return None
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+        
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+        
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+            
+        # Rows hold the final text, so painting never calls into the services
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][self._DISPLAY_FIELDS[index.column()]]
+        if role == Qt.UserRole:
+            # Base symbol for API operations
+            return self._rows[index.row()][1]
+        return None
 
 
 class StrategiesTab(QWidget):
     """Tab for strategy management."""
     
+    # Stylesheet for the section header labels, applied once to the whole tab
+    _HEADER_QSS = "QLabel[role='section-header'] { font-weight: bold; font-size: 14px; }"
+    
     def __init__(
         self, 
         binance_service: BinanceService, 
@@ -130,18 +348,41 @@ class StrategiesTab(QWidget):
         self.strategy_manager = strategy_manager
         self.logger = logging.getLogger(__name__)
         
+        # Set when assignments change while the tab is hidden
+        self._assignments_dirty = False
+        
+        # Symbol the assignment context menu was last opened for
+        self._context_menu_symbol: Optional[str] = None
+        
+        # Assignment dialogs, built on first use and reused
+        self._add_dialog: Optional[QDialog] = None
+        self._add_dialog_items: Optional[Tuple[List[str], ...]] = None
+        self._remove_dialog: Optional[QDialog] = None
+        
+        # Table contents from the last refresh, to skip refreshes that change nothing
+        self._last_strategies_snapshot: Optional[Tuple] = None
+        self._last_assignments_snapshot: Optional[Tuple] = None
+        
+        # Collapses bursts of assignment changes into one rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh_assignments)
+        
         # Setup UI
         self._setup_ui()
         
         # Connect signals
         self._connect_signals()
         
-        # Load initial data
-        self.refresh_strategies()
-        self.refresh_assignments()
+        # Load initial data once the event loop runs, so the tab shows first
+        QTimer.singleShot(0, self.refresh_strategies)
+        QTimer.singleShot(0, self.refresh_assignments)
         
     def _setup_ui(self):
         """Setup the user interface."""
+        self.setStyleSheet(self._HEADER_QSS)
+        
         # Main layout
         main_layout = QVBoxLayout(self)
         
@@ -155,13 +396,13 @@ class StrategiesTab(QWidget):
         
         # Strategies label
         strategies_label = QLabel("Available Strategies")
-        strategies_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        strategies_label.setProperty("role", "section-header")
         strategies_layout.addWidget(strategies_label)
         
         # Strategies table
-        self.strategies_table = QTableWidget()
-        self.strategies_table.setColumnCount(2)
-        self.strategies_table.setHorizontalHeaderLabels(["Strategy", "Description"])
+        self.strategies_model = StrategyTableModel(self)
+        self.strategies_table = QTableView()
+        self.strategies_table.setModel(self.strategies_model)
         self.strategies_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.strategies_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.strategies_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -184,13 +425,13 @@ class StrategiesTab(QWidget):
         
         # Assignments label
         assignments_label = QLabel("Strategy Assignments")
-        assignments_label.setStyleSheet("font-weight: bold; font-size: 14px;")
+        assignments_label.setProperty("role", "section-header")
         assignments_layout.addWidget(assignments_label)
         
         # Assignments table
-        self.assignments_table = QTableWidget()
-        self.assignments_table.setColumnCount(2)
-        self.assignments_table.setHorizontalHeaderLabels(["Asset", "Assigned Strategies"])
+        self.assignments_model = AssignmentModel(self)
+        self.assignments_table = QTableView()
+        self.assignments_table.setModel(self.assignments_model)
         self.assignments_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.assignments_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.assignments_table.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -217,15 +458,32 @@ class StrategiesTab(QWidget):
         # Set splitter sizes
         splitter.setSizes([400, 400])
         
+        # Reused by every assignment context menu
+        self._strategy_actions = self._build_strategy_actions()
+        
+    def _build_strategy_actions(self) -> Dict[str, QAction]:
+        """Create one checkable action per available strategy.
+        
+        Returns:
+            Dict[str, QAction]: Strategy ID -> action for the "Manage Strategies" submenu
+        """
+        actions = {}
+        
+        for strategy in self.strategy_manager.get_all_strategies():
+            action = QAction(strategy.name, self)
+            action.setCheckable(True)
+            action.setData(strategy.strategy_id)
+            action.triggered[bool].connect(self._on_manage_strategy_toggled)
+            actions[strategy.strategy_id] = action
+            
+        return actions
+        
     def _connect_signals(self):
         """Connect signals from services and widgets."""
         # Connect strategy manager signals
-        self.strategy_manager.strategy_assigned.connect(
-            lambda symbol, strategy_id: self.refresh_assignments()
-        )
-        self.strategy_manager.strategy_removed.connect(
-            lambda symbol, strategy_id: self.refresh_assignments()
-        )
+        self.strategy_manager.strategy_assigned.connect(self._on_assignment_changed)
+        self.strategy_manager.strategy_removed.connect(self._on_assignment_changed)
+        self.strategy_manager.strategies_cleared.connect(self._on_strategies_cleared)
         
         # Connect widget signals
         self.strategies_table.customContextMenuRequested.connect(
@@ -238,54 +496,119 @@ class StrategiesTab(QWidget):
         self.add_assignment_button.clicked.connect(self._add_assignment)
         self.remove_assignment_button.clicked.connect(self._remove_assignment)
         
+    @pyqtSlot(str, str)
+    def _on_assignment_changed(self, symbol: str, strategy_id: str):
+        """Refresh after a strategy assignment changed.
+        
+        Args:
+            symbol: Asset symbol
+            strategy_id: Strategy ID
+        """
+        self._mark_assignments_dirty()
+        
+    @pyqtSlot(str)
+    def _on_strategies_cleared(self, symbol: str):
+        """Refresh after all strategies were removed from an asset.
+        
+        Args:
+            symbol: Asset symbol
+        """
+        self._mark_assignments_dirty()
+        
+    def showEvent(self, event):
+        """Catch up on assignment changes made while the tab was hidden."""
+        if self._assignments_dirty:
+            self.refresh_assignments()
+        super().showEvent(event)
+        
+    def _mark_assignments_dirty(self):
+        """Refresh assignments shortly if visible, otherwise on the next show."""
+        if self.isVisible():
+            # Restarting the timer coalesces changes arriving within the interval
+            self._refresh_timer.start()
+        else:
+            self._assignments_dirty = True
+            
     def refresh_strategies(self):
         """Refresh the strategies table."""
         strategies = self.strategy_manager.get_all_strategies()
         
-        self.strategies_table.setRowCount(len(strategies))
+        # Nothing to do if the listed strategies are unchanged
+        snapshot = tuple((s.strategy_id, s.name, s.description) for s in strategies)
+        if snapshot == self._last_strategies_snapshot:
+            return
+        self._last_strategies_snapshot = snapshot
+        
+        self._populate(
+            self.strategies_table,
+            partial(self.strategies_model.set_strategies, strategies)
+        )
         
-        for row, strategy in enumerate(strategies):
-            # Strategy name
-            name_item = QTableWidgetItem(strategy.name)
-            name_item.setData(Qt.UserRole, strategy.strategy_id)
-            self.strategies_table.setItem(row, 0, name_item)
-            
-            # Strategy description
-            desc_item = QTableWidgetItem(strategy.description)
-            self.strategies_table.setItem(row, 1, desc_item)
-            
     def refresh_assignments(self):
         """Refresh the assignments table."""
+        self._assignments_dirty = False
+        self._refresh_timer.stop()
+        
         # Get all assets with strategies
         assets_with_strategies = self.strategy_manager.get_assets_with_strategies()
+        entries = []
         
-        self.assignments_table.setRowCount(len(assets_with_strategies))
+        # Index assets and strategies once instead of scanning them per row;
+        # reversed so the first asset with a base symbol wins, as in a linear scan
+        asset_by_symbol = {
+            a.base_symbol: a for a in reversed(self.portfolio_manager.get_all_assets())
+        }
+        strategy_by_id = {s.strategy_id: s for s in self.strategy_manager.get_all_strategies()}
         
-        for row, symbol in enumerate(assets_with_strategies):
+        for symbol in assets_with_strategies:
             # Find the asset object to get display name
-            asset = None
-            for a in self.portfolio_manager.get_all_assets():
-                if a.base_symbol == symbol:
-                    asset = a
-                    break
+            asset = asset_by_symbol.get(symbol)
             
-            # Asset symbol - display the formatted name but store the base symbol for API calls
+            # Asset symbol - display the formatted name but keep the base symbol for API calls
             display_text = asset.display_name if asset else symbol
-            symbol_item = QTableWidgetItem(display_text)
-            symbol_item.setData(Qt.UserRole, symbol)  # Store the base symbol for API operations
-            self.assignments_table.setItem(row, 0, symbol_item)
-            
-            # Assigned strategies
-            strategy_ids = self.strategy_manager.get_asset_strategy_ids(symbol)
-            strategy_names = []
-            
-            for strategy_id in strategy_ids:
-                strategy = self.strategy_manager.get_strategy(strategy_id)
-                if strategy:
-                    strategy_names.append(strategy.name)
-                    
-            strategies_item = QTableWidgetItem(", ".join(strategy_names))
-            self.assignments_table.setItem(row, 1, strategies_item)
+            
+            # Assigned strategies, sorted so an unchanged assignment set always
+            # compares equal
+            strategy_ids = tuple(sorted(self.strategy_manager.get_asset_strategy_ids(symbol)))
+            entries.append((display_text, symbol, strategy_ids))
+            
+        # Nothing to do if the displayed assignments are unchanged
+        snapshot = tuple(entries)
+        if snapshot == self._last_assignments_snapshot:
+            return
+        self._last_assignments_snapshot = snapshot
+        
+        # Join the strategy names once per row
+        rows = [
+            (display_text, symbol, ", ".join(sorted(
+                strategy_by_id[strategy_id].name
+                for strategy_id in strategy_ids if strategy_id in strategy_by_id
+            )))
+            for display_text, symbol, strategy_ids in entries
+        ]
+        
+        self._populate(self.assignments_table, partial(self.assignments_model.set_rows, rows))
+        
+    def _populate(self, table: QTableView, update):
+        """Apply a model update with painting, sorting and stretching suspended.
+        
+        Args:
+            table: View showing the updated model
+            update: Callable that updates the model
+        """
+        header = table.horizontalHeader()
+        was_sorted = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        # A fixed section avoids re-stretching while rows change
+        header.setSectionResizeMode(1, QHeaderView.Fixed)
+        try:
+            update()
+        finally:
+            header.setSectionResizeMode(1, QHeaderView.Stretch)
+            table.setSortingEnabled(was_sorted)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
             
     def _show_strategy_context_menu(self, position):
         """Show context menu for strategies table.
@@ -296,27 +619,20 @@ class StrategiesTab(QWidget):
         menu = QMenu()
         
         # Get selected item
-        selected_indexes = self.strategies_table.selectedIndexes()
-        if not selected_indexes:
+        current = self.strategies_table.currentIndex()
+        if not current.isValid():
             return
             
-        # Get strategy from the selected row
-        row = selected_indexes[0].row()
-        strategy_item = self.strategies_table.item(row, 0)
-        if not strategy_item:
-            return
-            
-        strategy_id = strategy_item.data(Qt.UserRole)
-        strategy = self.strategy_manager.get_strategy(strategy_id)
+        # Get strategy from the current row
+        row = current.row()
+        strategy = self.strategies_model.strategy_at(row)
         
         if not strategy:
             return
             
         # Configure action
-        configure_action = QAction(f"Configure {strategy.name}", self)
-        configure_action.triggered.connect(
-            lambda: self._configure_strategy(strategy)
-        )
+        configure_action = QAction(f"Configure {strategy.name}", menu)
+        configure_action.triggered.connect(partial(self._configure_strategy, strategy))
         menu.addAction(configure_action)
         
         # Show menu
@@ -331,41 +647,33 @@ class StrategiesTab(QWidget):
         menu = QMenu()
         
         # Get selected item
-        selected_indexes = self.assignments_table.selectedIndexes()
-        if not selected_indexes:
+        current = self.assignments_table.currentIndex()
+        if not current.isValid():
             return
             
-        # Get symbol from the selected row
-        row = selected_indexes[0].row()
-        symbol_item = self.assignments_table.item(row, 0)
-        if not symbol_item:
+        # Get symbol from the current row
+        row = current.row()
+        # Get the base symbol for API operations
+        symbol = self.assignments_model.symbol_at(row)
+        if not symbol:
             return
-            
-        # Get the base symbol from user data for API operations
-        symbol = symbol_item.data(Qt.UserRole)
         
-        # Get assigned strategies
-        assigned_strategies = self.strategy_manager.get_asset_strategy_ids(symbol)
+        # Snapshot the assigned strategies rather than holding the manager's live set
+        assigned_strategies = frozenset(self.strategy_manager.get_asset_strategy_ids(symbol))
+        self._context_menu_symbol = symbol
         
-        # Add strategies submenu
+        # Add strategies submenu, reusing the cached actions
         strategy_menu = menu.addMenu("Manage Strategies")
         
-        for strategy in self.strategy_manager.get_all_strategies():
-            strategy_action = QAction(strategy.name, self)
-            strategy_action.setCheckable(True)
-            strategy_action.setChecked(strategy.strategy_id in assigned_strategies)
-            strategy_action.triggered.connect(
-                lambda checked, s=strategy.strategy_id: 
-                self._toggle_strategy(symbol, s, checked)
-            )
-            strategy_menu.addAction(strategy_action)
+        for strategy_id, action in self._strategy_actions.items():
+            action.setChecked(strategy_id in assigned_strategies)
             
+        strategy_menu.addActions(list(self._strategy_actions.values()))
+        
         # Remove all strategies action
         menu.addSeparator()
-        remove_all_action = QAction(f"Remove All Strategies from {symbol}", self)
-        remove_all_action.triggered.connect(
-            lambda: self._remove_all_strategies(symbol)
-        )
+        remove_all_action = QAction(f"Remove All Strategies from {symbol}", menu)
+        remove_all_action.triggered.connect(partial(self._remove_all_strategies, symbol))
         menu.addAction(remove_all_action)
         
         # Show menu
@@ -374,67 +682,54 @@ class StrategiesTab(QWidget):
     def _configure_selected_strategy(self):
         """Configure the selected strategy."""
         # Get selected strategy
-        selected_indexes = self.strategies_table.selectedIndexes()
-        if not selected_indexes:
+        current = self.strategies_table.currentIndex()
+        if not current.isValid():
             return
             
-        # Get strategy from the selected row
-        row = selected_indexes[0].row()
-        strategy_item = self.strategies_table.item(row, 0)
-        if not strategy_item:
-            return
-            
-        strategy_id = strategy_item.data(Qt.UserRole)
-        strategy = self.strategy_manager.get_strategy(strategy_id)
+        # Get strategy from the current row
+        row = current.row()
+        strategy = self.strategies_model.strategy_at(row)
         
         if strategy:
             self._configure_strategy(strategy)
             
-    def _configure_strategy(self, strategy: Strategy):
+    def _configure_strategy(self, strategy: Strategy, checked: bool = False):
         """Show dialog to configure a strategy.
         
         Args:
             strategy: Strategy to configure
+            checked: Unused check state passed by the action
         """
         dialog = StrategyConfigDialog(self, strategy)
         
         if dialog.exec_() == QDialog.Accepted:
-            # Update strategy parameters
-            parameters = dialog.get_parameters()
+            # Update strategy parameters and refresh signals on the strategy
+            # manager's thread; new signals reach the UI through signal_generated
+            QMetaObject.invokeMethod(
+                self.strategy_manager, "configure_strategy", Qt.QueuedConnection,
+                Q_ARG(str, strategy.strategy_id), Q_ARG(object, dialog.get_parameters())
+            )
             
-            for name, value in parameters.items():
-                strategy.set_parameter(name, value)
-                
-            # Refresh signals using this strategy
-            self.strategy_manager.refresh_all_signals()
+    def _build_combo_dialog(self, title: str, fields: List[Tuple[str, QComboBox]]) -> QDialog:
+        """Create an OK/Cancel dialog with labelled combo boxes.
+        
+        Args:
+            title: Window title
+            fields: (label, combo box) pairs in display order
             
-    def _add_assignment(self):
-        """Add a new strategy assignment."""
-        # Create dialog to select asset and strategy
+        Returns:
+            QDialog: The dialog, kept for reuse by the caller
+        """
         dialog = QDialog(self)
-        dialog.setWindowTitle("Add Strategy Assignment")
+        dialog.setWindowTitle(title)
         dialog.setMinimumWidth(400)
         
         # Setup layout
         layout = QFormLayout(dialog)
         
-        # Asset combo
-        asset_combo = QComboBox()
-        assets = self.portfolio_manager.get_all_assets()
-        for asset in assets:
-            # Use display_name for UI but store base_symbol as user data for API calls
-            asset_combo.addItem(asset.display_name, asset.base_symbol)
-            
-        layout.addRow("Asset:", asset_combo)
-        
-        # Strategy combo
-        strategy_combo = QComboBox()
-        strategies = self.strategy_manager.get_all_strategies()
-        for strategy in strategies:
-            strategy_combo.addItem(strategy.name, strategy.strategy_id)
+        for label, combo in fields:
+            layout.addRow(label, combo)
             
-        layout.addRow("Strategy:", strategy_combo)
-        
         # Add buttons
         button_box = QDialogButtonBox(
             QDialogButtonBox.Ok | QDialogButtonBox.Cancel
@@ -445,62 +740,92 @@ class StrategiesTab(QWidget):
         button_box.accepted.connect(dialog.accept)
         button_box.rejected.connect(dialog.reject)
         
-        if dialog.exec_() == QDialog.Accepted:
+        return dialog
+        
+    def _add_assignment(self):
+        """Add a new strategy assignment."""
+        # Create the dialog to select asset and strategy on first use
+        if self._add_dialog is None:
+            self._add_asset_combo = QComboBox()
+            self._add_strategy_combo = QComboBox()
+            self._add_dialog = self._build_combo_dialog(
+                "Add Strategy Assignment",
+                [("Asset:", self._add_asset_combo), ("Strategy:", self._add_strategy_combo)]
+            )
+            
+        # Refill the combos only when the assets or strategies changed
+        assets = self.portfolio_manager.get_all_assets()
+        strategies = self.strategy_manager.get_all_strategies()
+        # Use display_name for UI but store base_symbol as user data for API calls
+        items = (
+            [asset.display_name for asset in assets],
+            [asset.base_symbol for asset in assets],
+            [strategy.name for strategy in strategies],
+            [strategy.strategy_id for strategy in strategies]
+        )
+        
+        if items != self._add_dialog_items:
+            self._add_dialog_items = items
+            self._add_asset_combo.clear()
+            _fill_combo(self._add_asset_combo, items[0], items[1])
+            self._add_strategy_combo.clear()
+            _fill_combo(self._add_strategy_combo, items[2], items[3])
+            
+        self._add_asset_combo.setCurrentIndex(0)
+        self._add_strategy_combo.setCurrentIndex(0)
+        
+        if self._add_dialog.exec_() == QDialog.Accepted:
             # Get the base symbol from user data (for API calls) rather than display text
-            symbol = asset_combo.currentData()
-            strategy_id = strategy_combo.currentData()
+            symbol = self._add_asset_combo.currentData()
+            strategy_id = self._add_strategy_combo.currentData()
             
-            self.strategy_manager.assign_strategy(symbol, strategy_id)
+            QMetaObject.invokeMethod(
+                self.strategy_manager, "assign_strategy", Qt.QueuedConnection,
+                Q_ARG(str, symbol), Q_ARG(str, strategy_id)
+            )
             
     def _remove_assignment(self):
         """Remove a strategy assignment."""
         # Get selected assignment
-        selected_indexes = self.assignments_table.selectedIndexes()
-        if not selected_indexes:
+        current = self.assignments_table.currentIndex()
+        if not current.isValid():
             return
             
-        # Get symbol from the selected row
-        row = selected_indexes[0].row()
-        symbol_item = self.assignments_table.item(row, 0)
-        if not symbol_item:
+        # Get symbol from the current row
+        row = current.row()
+        # Get the base symbol for API operations
+        symbol = self.assignments_model.symbol_at(row)
+        if not symbol:
             return
-            
-        # Get the base symbol from user data for API operations
-        symbol = symbol_item.data(Qt.UserRole)
         
-        # Create dialog to select strategy to remove
-        dialog = QDialog(self)
-        dialog.setWindowTitle(f"Remove Strategy from {symbol}")
-        dialog.setMinimumWidth(400)
-        
-        # Setup layout
-        layout = QFormLayout(dialog)
+        # Create the dialog to select strategy to remove on first use
+        if self._remove_dialog is None:
+            self._remove_strategy_combo = QComboBox()
+            self._remove_dialog = self._build_combo_dialog(
+                "", [("Strategy to Remove:", self._remove_strategy_combo)]
+            )
+            
+        self._remove_dialog.setWindowTitle(f"Remove Strategy from {symbol}")
         
         # Strategy combo
-        strategy_combo = QComboBox()
-        assigned_strategy_ids = self.strategy_manager.get_asset_strategy_ids(symbol)
-        
-        for strategy_id in assigned_strategy_ids:
-            strategy = self.strategy_manager.get_strategy(strategy_id)
-            if strategy:
-                strategy_combo.addItem(strategy.name, strategy_id)
-                
-        layout.addRow("Strategy to Remove:", strategy_combo)
-        
-        # Add buttons
-        button_box = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+        assigned_strategies = self.strategy_manager.get_asset_strategies(symbol)
+        self._remove_strategy_combo.clear()
+        _fill_combo(
+            self._remove_strategy_combo,
+            [strategy.name for strategy in assigned_strategies],
+            [strategy.strategy_id for strategy in assigned_strategies]
         )
-        layout.addRow(button_box)
-        
-        # Connect signals
-        button_box.accepted.connect(dialog.accept)
-        button_box.rejected.connect(dialog.reject)
         
-        if dialog.exec_() == QDialog.Accepted and strategy_combo.count() > 0:
-            strategy_id = strategy_combo.currentData()
+        if (
+            self._remove_dialog.exec_() == QDialog.Accepted
+            and self._remove_strategy_combo.count() > 0
+        ):
+            strategy_id = self._remove_strategy_combo.currentData()
             
-            self.strategy_manager.remove_strategy(symbol, strategy_id)
+            QMetaObject.invokeMethod(
+                self.strategy_manager, "remove_strategy", Qt.QueuedConnection,
+                Q_ARG(str, symbol), Q_ARG(str, strategy_id)
+            )
             
     def _toggle_strategy(self, symbol: str, strategy_id: str, assign: bool):
         """Toggle a strategy assignment.
@@ -510,18 +835,31 @@ class StrategiesTab(QWidget):
             strategy_id: Strategy ID
             assign: Whether to assign or remove
         """
-        if assign:
-            self.strategy_manager.assign_strategy(symbol, strategy_id)
-        else:
-            self.strategy_manager.remove_strategy(symbol, strategy_id)
+        method = "assign_strategy" if assign else "remove_strategy"
+        QMetaObject.invokeMethod(
+            self.strategy_manager, method, Qt.QueuedConnection,
+            Q_ARG(str, symbol), Q_ARG(str, strategy_id)
+        )
             
-    def _remove_all_strategies(self, symbol: str):
+    @pyqtSlot(bool)
+    def _on_manage_strategy_toggled(self, checked: bool):
+        """Toggle the sending action's strategy on the context menu's asset.
+        
+        Args:
+            checked: Whether to assign or remove
+        """
+        action = self.sender()
+        if action is not None and self._context_menu_symbol:
+            self._toggle_strategy(self._context_menu_symbol, action.data(), checked)
+            
+    def _remove_all_strategies(self, symbol: str, checked: bool = False):
         """Remove all strategies from an asset.
         
         Args:
             symbol: Asset symbol
+            checked: Unused check state passed by the action
         """
-        assigned_strategy_ids = self.strategy_manager.get_asset_strategy_ids(symbol)
-        
-        for strategy_id in list(assigned_strategy_ids):
-            self.strategy_manager.remove_strategy(symbol, strategy_id)
+        QMetaObject.invokeMethod(
+            self.strategy_manager, "remove_all_strategies", Qt.QueuedConnection,
+            Q_ARG(str, symbol)
+        )
@@ -2,371 +2,483 @@
 Dark theme implementation for the application.
 Provides stylesheets and color definitions for a consistent UI appearance.
 """
-from PyQt5.QtGui import QColor, QPalette, QBrush
-from PyQt5.QtCore import Qt
+import re
+from dataclasses import asdict, astuple, dataclass
+from functools import lru_cache
+from string import Template
+
+from PyQt5.QtGui import QColor, QPalette
 
 
 # Color palette for dark theme
-class DarkThemeColors:
-    """Color definitions for dark theme."""
+@dataclass(frozen=True)
+class DarkTheme:
+    """Color definitions for dark theme.
+    
+    Other themes can be derived with dataclasses.replace().
+    """
     
     # Main colors
-    BACKGROUND = "#1E1E2E"
-    CARD_BACKGROUND = "#2A2A3C"
-    PRIMARY = "#6272A4"
-    SECONDARY = "#44475A"
-    ACCENT = "#BD93F9"
+    BACKGROUND: str = "#1E1E2E"
+    CARD_BACKGROUND: str = "#2A2A3C"
+    PRIMARY: str = "#6272A4"
+    SECONDARY: str = "#44475A"
+    ACCENT: str = "#BD93F9"
     
     # Text colors
-    TEXT_PRIMARY = "#F8F8F2"
-    TEXT_SECONDARY = "#CCCCCC"
-    TEXT_DISABLED = "#6272A4"
+    TEXT_PRIMARY: str = "#F8F8F2"
+    TEXT_SECONDARY: str = "#CCCCCC"
+    TEXT_DISABLED: str = "#6272A4"
     
     # Status colors
-    SUCCESS = "#50FA7B"
-    WARNING = "#FFB86C"
-    ERROR = "#FF5555"
-    INFO = "#8BE9FD"
+    SUCCESS: str = "#50FA7B"
+    WARNING: str = "#FFB86C"
+    ERROR: str = "#FF5555"
+    INFO: str = "#8BE9FD"
     
     # Trading specific colors
-    PROFIT = "#50FA7B"  # Green
-    LOSS = "#FF5555"    # Red
-    NEUTRAL = "#F8F8F2" # White
+    PROFIT: str = "#50FA7B"  # Green
+    LOSS: str = "#FF5555"    # Red
+    NEUTRAL: str = "#F8F8F2" # White
     
     # Chart colors
-    CHART_LINE = "#BD93F9"
-    CHART_GRID = "#44475A"
-    CHART_BACKGROUND = "#282A36"
+    CHART_LINE: str = "#BD93F9"
+    CHART_GRID: str = "#44475A"
+    CHART_BACKGROUND: str = "#282A36"
     
     # Table colors
-    TABLE_HEADER = "#44475A"
-    TABLE_ALTERNATE_ROW = "#2D2D42"
-    TABLE_SELECTED_ROW = "#6272A4"
+    TABLE_HEADER: str = "#44475A"
+    TABLE_ALTERNATE_ROW: str = "#2D2D42"
+    TABLE_SELECTED_ROW: str = "#6272A4"
     
     # Border colors
-    BORDER = "#44475A"
+    BORDER: str = "#44475A"
+
+
+# The dark theme colors, read as DarkThemeColors.BORDER etc.
+DarkThemeColors = DarkTheme()
 
 
-def get_application_stylesheet():
-    """Get the application-wide stylesheet."""
-    return f"""
+# Theme color -> (red, green, blue), parsed once instead of by Qt's color name parser
+_RGB = {
+    value: tuple(int(value[i:i + 2], 16) for i in (1, 3, 5))
+    for value in astuple(DarkThemeColors)
+    if value.startswith("#")
+}
+
+# One QColor per distinct theme color, shared by the palette and change colors
+_QCOLORS = {value: QColor.fromRgb(*rgb) for value, rgb in _RGB.items()}
+
+
+# Stylesheet fragments with $COLOR placeholders for the theme colors
+_MAINWINDOW_QSS = Template("""
     /* Global Styles */
-    QWidget {{
-        background-color: {DarkThemeColors.BACKGROUND};
-        color: {DarkThemeColors.TEXT_PRIMARY};
+    QWidget {
+        background-color: $BACKGROUND;
+        color: $TEXT_PRIMARY;
         font-family: "Segoe UI", Arial, sans-serif;
-    }}
-    
-    /* Main Window */
-    QMainWindow {{
-        background-color: {DarkThemeColors.BACKGROUND};
-    }}
+    }
     
     /* Menu Bar */
-    QMenuBar {{
-        background-color: {DarkThemeColors.CARD_BACKGROUND};
-        color: {DarkThemeColors.TEXT_PRIMARY};
-        border-bottom: 1px solid {DarkThemeColors.BORDER};
-    }}
+    QMenuBar {
+        background-color: $CARD_BACKGROUND;
+        border-bottom: 1px solid $BORDER;
+    }
     
-    QMenuBar::item {{
+    QMenuBar::item {
         background-color: transparent;
         padding: 6px 10px;
-    }}
+    }
     
-    QMenuBar::item:selected {{
-        background-color: {DarkThemeColors.PRIMARY};
-        color: {DarkThemeColors.TEXT_PRIMARY};
-    }}
+    QMenuBar::item:selected {
+        background-color: $PRIMARY;
+        color: $TEXT_PRIMARY;
+    }
     
-    QMenu {{
-        background-color: {DarkThemeColors.CARD_BACKGROUND};
-        border: 1px solid {DarkThemeColors.BORDER};
+    QMenu {
+        background-color: $CARD_BACKGROUND;
+        border: 1px solid $BORDER;
         padding: 5px;
-    }}
+    }
     
-    QMenu::item {{
+    QMenu::item {
         padding: 5px 25px 5px 20px;
         border-radius: 4px;
-    }}
+    }
     
-    QMenu::item:selected {{
-        background-color: {DarkThemeColors.PRIMARY};
-    }}
+    QMenu::item:selected {
+        background-color: $PRIMARY;
+    }
     
     /* Status Bar */
-    QStatusBar {{
-        background-color: {DarkThemeColors.CARD_BACKGROUND};
-        color: {DarkThemeColors.TEXT_SECONDARY};
-        border-top: 1px solid {DarkThemeColors.BORDER};
-    }}
+    QStatusBar {
+        background-color: $CARD_BACKGROUND;
+        color: $TEXT_SECONDARY;
+        border-top: 1px solid $BORDER;
+    }
     
     /* Tab Widget */
-    QTabWidget::pane {{
-        border: 1px solid {DarkThemeColors.BORDER};
-        background-color: {DarkThemeColors.BACKGROUND};
-    }}
-    
-    QTabBar::tab {{
-        background-color: {DarkThemeColors.SECONDARY};
-        color: {DarkThemeColors.TEXT_SECONDARY};
+    QTabWidget::pane {
+        border: 1px solid $BORDER;
+        background-color: $BACKGROUND;
+    }
+    
+    QTabBar::tab {
+        background-color: $SECONDARY;
+        color: $TEXT_SECONDARY;
         padding: 8px 16px;
         border-top-left-radius: 4px;
         border-top-right-radius: 4px;
         margin-right: 2px;
-    }}
-    
-    QTabBar::tab:selected {{
-        background-color: {DarkThemeColors.ACCENT};
-        color: {DarkThemeColors.TEXT_PRIMARY};
-    }}
-    
-    /* Table Widget */
-    QTableWidget {{
-        background-color: {DarkThemeColors.CARD_BACKGROUND};
-        alternate-background-color: {DarkThemeColors.TABLE_ALTERNATE_ROW};
-        gridline-color: {DarkThemeColors.BORDER};
-        border: 1px solid {DarkThemeColors.BORDER};
+    }
+    
+    QTabBar::tab:selected {
+        background-color: $ACCENT;
+        color: $TEXT_PRIMARY;
+    }
+""")
+
+_TABLE_QSS = Template("""
+    /* Table Views */
+    QTableView {
+        background-color: $CARD_BACKGROUND;
+        alternate-background-color: $TABLE_ALTERNATE_ROW;
+        gridline-color: $BORDER;
+        border: 1px solid $BORDER;
         border-radius: 4px;
-    }}
+    }
     
-    QTableWidget::item {{
+    QTableView::item {
         padding: 5px;
-    }}
+    }
     
-    QTableWidget::item:selected {{
-        background-color: {DarkThemeColors.TABLE_SELECTED_ROW};
-    }}
+    QTableView::item:selected {
+        background-color: $TABLE_SELECTED_ROW;
+    }
     
-    QHeaderView::section {{
-        background-color: {DarkThemeColors.TABLE_HEADER};
-        color: {DarkThemeColors.TEXT_PRIMARY};
+    QHeaderView::section {
+        background-color: $TABLE_HEADER;
+        color: $TEXT_PRIMARY;
         padding: 5px;
         border: none;
-        border-right: 1px solid {DarkThemeColors.BORDER};
-        border-bottom: 1px solid {DarkThemeColors.BORDER};
-    }}
-    
+        border-right: 1px solid $BORDER;
+        border-bottom: 1px solid $BORDER;
+    }
+""")
+
+_CONTROLS_QSS = Template("""
     /* Buttons */
-    QPushButton {{
-        background-color: {DarkThemeColors.PRIMARY};
-        color: {DarkThemeColors.TEXT_PRIMARY};
+    QPushButton {
+        background-color: $PRIMARY;
         border: none;
         border-radius: 4px;
         padding: 8px 16px;
         font-weight: bold;
-    }}
+    }
     
-    QPushButton:hover {{
-        background-color: {DarkThemeColors.ACCENT};
-    }}
+    QPushButton:hover {
+        background-color: $ACCENT;
+    }
     
-    QPushButton:pressed {{
-        background-color: {DarkThemeColors.SECONDARY};
-    }}
+    QPushButton:pressed {
+        background-color: $SECONDARY;
+    }
     
-    QPushButton:disabled {{
-        background-color: {DarkThemeColors.SECONDARY};
-        color: {DarkThemeColors.TEXT_DISABLED};
-    }}
+    QPushButton:disabled {
+        background-color: $SECONDARY;
+        color: $TEXT_DISABLED;
+    }
     
     /* Input Fields */
-    QLineEdit, QTextEdit, QComboBox {{
-        background-color: {DarkThemeColors.SECONDARY};
-        color: {DarkThemeColors.TEXT_PRIMARY};
-        border: 1px solid {DarkThemeColors.BORDER};
+    QLineEdit, QTextEdit, QComboBox {
+        background-color: $SECONDARY;
+        border: 1px solid $BORDER;
         border-radius: 4px;
         padding: 6px;
-    }}
+    }
     
-    QLineEdit:focus, QTextEdit:focus, QComboBox:focus {{
-        border: 1px solid {DarkThemeColors.ACCENT};
-    }}
+    QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+        border: 1px solid $ACCENT;
+    }
     
     /* Combo Box */
-    QComboBox {{
-        background-color: {DarkThemeColors.SECONDARY};
-        selection-background-color: {DarkThemeColors.ACCENT};
+    QComboBox {
+        selection-background-color: $ACCENT;
         padding-right: 15px;
-    }}
+    }
     
-    QComboBox::drop-down {{
+    QComboBox::drop-down {
         subcontrol-origin: padding;
         subcontrol-position: top right;
         width: 15px;
         border-left-width: 1px;
-        border-left-color: {DarkThemeColors.BORDER};
+        border-left-color: $BORDER;
         border-left-style: solid;
-    }}
+    }
     
-    QComboBox QAbstractItemView {{
-        background-color: {DarkThemeColors.CARD_BACKGROUND};
-        border: 1px solid {DarkThemeColors.BORDER};
-        selection-background-color: {DarkThemeColors.ACCENT};
-    }}
+    QComboBox QAbstractItemView {
+        background-color: $CARD_BACKGROUND;
+        border: 1px solid $BORDER;
+        selection-background-color: $ACCENT;
+    }
     
     /* Scroll Bars */
-    QScrollBar:vertical {{
+    QScrollBar {
         border: none;
-        background-color: {DarkThemeColors.SECONDARY};
-        width: 10px;
-        margin: 15px 0 15px 0;
+        background-color: $SECONDARY;
         border-radius: 5px;
-    }}
-    
-    QScrollBar::handle:vertical {{
-        background-color: {DarkThemeColors.PRIMARY};
-        min-height: 30px;
-        border-radius: 5px;
-    }}
-    
-    QScrollBar::handle:vertical:hover {{
-        background-color: {DarkThemeColors.ACCENT};
-    }}
+    }
     
-    QScrollBar::sub-line:vertical, QScrollBar::add-line:vertical {{
-        border: none;
-        background: none;
-        height: 15px;
-    }}
+    QScrollBar:vertical {
+        width: 10px;
+        margin: 15px 0 15px 0;
+    }
     
-    QScrollBar:horizontal {{
-        border: none;
-        background-color: {DarkThemeColors.SECONDARY};
+    QScrollBar:horizontal {
         height: 10px;
         margin: 0 15px 0 15px;
+    }
+    
+    QScrollBar::handle {
+        background-color: $PRIMARY;
         border-radius: 5px;
-    }}
+    }
+    
+    QScrollBar::handle:vertical {
+        min-height: 30px;
+    }
     
-    QScrollBar::handle:horizontal {{
-        background-color: {DarkThemeColors.PRIMARY};
+    QScrollBar::handle:horizontal {
         min-width: 30px;
-        border-radius: 5px;
-    }}
+    }
     
-    QScrollBar::handle:horizontal:hover {{
-        background-color: {DarkThemeColors.ACCENT};
-    }}
+    QScrollBar::handle:hover {
+        background-color: $ACCENT;
+    }
     
-    QScrollBar::sub-line:horizontal, QScrollBar::add-line:horizontal {{
+    QScrollBar::sub-line, QScrollBar::add-line {
         border: none;
         background: none;
-        width: 15px;
-    }}
+    }
     
-    /* Dialogs */
-    QDialog {{
-        background-color: {DarkThemeColors.BACKGROUND};
-        border: 1px solid {DarkThemeColors.BORDER};
-    }}
+    QScrollBar::sub-line:vertical, QScrollBar::add-line:vertical {
+        height: 15px;
+    }
+    
+    QScrollBar::sub-line:horizontal, QScrollBar::add-line:horizontal {
+        width: 15px;
+    }
     
     /* Checkboxes */
-    QCheckBox {{
+    QCheckBox {
         spacing: 5px;
-    }}
+    }
     
-    QCheckBox::indicator {{
+    QCheckBox::indicator {
         width: 18px;
         height: 18px;
         border-radius: 3px;
-        border: 1px solid {DarkThemeColors.BORDER};
-    }}
+        border: 1px solid $BORDER;
+    }
     
-    QCheckBox::indicator:unchecked {{
-        background-color: {DarkThemeColors.SECONDARY};
-    }}
+    QCheckBox::indicator:unchecked {
+        background-color: $SECONDARY;
+    }
     
-    QCheckBox::indicator:checked {{
-        background-color: {DarkThemeColors.ACCENT};
-    }}
+    QCheckBox::indicator:checked {
+        background-color: $ACCENT;
+    }
     
     /* Splitter */
-    QSplitter::handle {{
-        background-color: {DarkThemeColors.BORDER};
-    }}
+    QSplitter::handle {
+        background-color: $BORDER;
+    }
     
-    QSplitter::handle:horizontal {{
+    QSplitter::handle:horizontal {
         width: 2px;
-    }}
+    }
     
-    QSplitter::handle:vertical {{
+    QSplitter::handle:vertical {
         height: 2px;
-    }}
-    
-    /* Labels */
-    QLabel {{
-        color: {DarkThemeColors.TEXT_PRIMARY};
-    }}
+    }
     
     /* Group Box */
-    QGroupBox {{
-        border: 1px solid {DarkThemeColors.BORDER};
+    QGroupBox {
+        border: 1px solid $BORDER;
         border-radius: 5px;
         margin-top: 10px;
         font-weight: bold;
-    }}
+    }
     
-    QGroupBox::title {{
+    QGroupBox::title {
         subcontrol-origin: margin;
         subcontrol-position: top left;
         left: 10px;
         padding: 0 5px;
-    }}
+    }
+""")
+
+_DIALOG_QSS = Template("""
+    /* Dialogs */
+    QDialog {
+        border: 1px solid $BORDER;
+    }
+""")
+
+
+# Comments and whitespace that Qt's CSS parser would only skip
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_QSS_SPACE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE = re.compile(r" ?([{};,]) ?")
+
+
+def _theme_colors(theme):
+    """Get the values substituted into the stylesheet templates.
+    
+    Args:
+        theme: Theme colors, such as DarkThemeColors
+        
+    Returns:
+        Dict: Color name -> value
     """
+    return asdict(theme)
 
 
-def get_dark_palette():
-    """Create and return a dark color palette for the application."""
-    palette = QPalette()
-    
+def _minify_qss(qss):
+    """Strip comments and redundant whitespace from a stylesheet.
+    
+    Args:
+        qss: Stylesheet text
+        
+    Returns:
+        The equivalent stylesheet without comments and layout whitespace
+    """
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_SPACE.sub(" ", qss)
+    return _QSS_PUNCT_SPACE.sub(r"\1", qss).strip()
+
+
+@lru_cache(maxsize=4)
+def get_mainwindow_qss(theme=DarkThemeColors):
+    """Get the stylesheet for the main window, its menus, status bar and tabs."""
+    return _MAINWINDOW_QSS.substitute(_theme_colors(theme))
+
+
+@lru_cache(maxsize=4)
+def get_table_qss(theme=DarkThemeColors):
+    """Get the stylesheet for table views and their headers."""
+    return _TABLE_QSS.substitute(_theme_colors(theme))
+
+
+@lru_cache(maxsize=4)
+def get_controls_qss(theme=DarkThemeColors):
+    """Get the stylesheet for buttons, inputs, scroll bars and other controls."""
+    return _CONTROLS_QSS.substitute(_theme_colors(theme))
+
+
+@lru_cache(maxsize=4)
+def get_dialog_qss(theme=DarkThemeColors):
+    """Get the stylesheet for dialogs."""
+    return _DIALOG_QSS.substitute(_theme_colors(theme))
+
+
+@lru_cache(maxsize=4)
+def get_application_stylesheet(theme=DarkThemeColors):
+    """Get the application-wide stylesheet.
+    
+    The stylesheet only depends on the theme's constant colors, so it is built
+    once per theme; switching themes only substitutes new colors into the
+    templates.
+    Menus, popups and dialogs are top-level windows, so the fragments are still
+    applied to the whole application rather than to individual containers.
+    The result is minified, since Qt's CSS parser walks every character.
+    """
+    return _minify_qss("".join((
+        get_mainwindow_qss(theme),
+        get_table_qss(theme),
+        get_controls_qss(theme),
+        get_dialog_qss(theme),
+    )))
+
+
+# (role, color) for all palette color groups
+_PALETTE_ROLES = (
     # Base colors
-    palette.setColor(QPalette.Window, QColor(DarkThemeColors.BACKGROUND))
-    palette.setColor(QPalette.WindowText, QColor(DarkThemeColors.TEXT_PRIMARY))
-    palette.setColor(QPalette.Base, QColor(DarkThemeColors.CARD_BACKGROUND))
-    palette.setColor(QPalette.AlternateBase, QColor(DarkThemeColors.TABLE_ALTERNATE_ROW))
-    palette.setColor(QPalette.ToolTipBase, QColor(DarkThemeColors.CARD_BACKGROUND))
-    palette.setColor(QPalette.ToolTipText, QColor(DarkThemeColors.TEXT_PRIMARY))
-    
+    (QPalette.Window, DarkThemeColors.BACKGROUND),
+    (QPalette.WindowText, DarkThemeColors.TEXT_PRIMARY),
+    (QPalette.Base, DarkThemeColors.CARD_BACKGROUND),
+    (QPalette.AlternateBase, DarkThemeColors.TABLE_ALTERNATE_ROW),
+    (QPalette.ToolTipBase, DarkThemeColors.CARD_BACKGROUND),
+    (QPalette.ToolTipText, DarkThemeColors.TEXT_PRIMARY),
     # Text colors
-    palette.setColor(QPalette.Text, QColor(DarkThemeColors.TEXT_PRIMARY))
-    palette.setColor(QPalette.Button, QColor(DarkThemeColors.PRIMARY))
-    palette.setColor(QPalette.ButtonText, QColor(DarkThemeColors.TEXT_PRIMARY))
-    palette.setColor(QPalette.BrightText, QColor(DarkThemeColors.TEXT_PRIMARY))
-    
+    (QPalette.Text, DarkThemeColors.TEXT_PRIMARY),
+    (QPalette.Button, DarkThemeColors.PRIMARY),
+    (QPalette.ButtonText, DarkThemeColors.TEXT_PRIMARY),
+    (QPalette.BrightText, DarkThemeColors.TEXT_PRIMARY),
     # Highlight colors
-    palette.setColor(QPalette.Highlight, QColor(DarkThemeColors.ACCENT))
-    palette.setColor(QPalette.HighlightedText, QColor(DarkThemeColors.TEXT_PRIMARY))
-    
-    # Disabled colors
-    palette.setColor(QPalette.Disabled, QPalette.Text, QColor(DarkThemeColors.TEXT_DISABLED))
-    palette.setColor(QPalette.Disabled, QPalette.ButtonText, QColor(DarkThemeColors.TEXT_DISABLED))
-    palette.setColor(QPalette.Disabled, QPalette.Highlight, QColor(DarkThemeColors.SECONDARY))
-    palette.setColor(QPalette.Disabled, QPalette.Base, QColor(DarkThemeColors.SECONDARY))
-    palette.setColor(QPalette.Disabled, QPalette.Button, QColor(DarkThemeColors.SECONDARY))
-    palette.setColor(QPalette.Disabled, QPalette.WindowText, QColor(DarkThemeColors.TEXT_DISABLED))
+    (QPalette.Highlight, DarkThemeColors.ACCENT),
+    (QPalette.HighlightedText, DarkThemeColors.TEXT_PRIMARY),
+)
+
+# (role, color) overrides for the disabled palette group
+_DISABLED_PALETTE_ROLES = (
+    (QPalette.Text, DarkThemeColors.TEXT_DISABLED),
+    (QPalette.ButtonText, DarkThemeColors.TEXT_DISABLED),
+    (QPalette.Highlight, DarkThemeColors.SECONDARY),
+    (QPalette.Base, DarkThemeColors.SECONDARY),
+    (QPalette.Button, DarkThemeColors.SECONDARY),
+    (QPalette.WindowText, DarkThemeColors.TEXT_DISABLED),
+)
+
+
+@lru_cache(maxsize=1)
+def _build_dark_palette():
+    """Build the dark palette once from the role tables."""
+    palette = QPalette()
     
+    for role, color in _PALETTE_ROLES:
+        palette.setColor(role, _QCOLORS[color])
+        
+    for role, color in _DISABLED_PALETTE_ROLES:
+        palette.setColor(QPalette.Disabled, role, _QCOLORS[color])
+        
     return palette
 
 
+def get_dark_palette():
+    """Create and return a dark color palette for the application.
+    
+    Returns a copy of a cached palette, which Qt shares implicitly until the
+    caller modifies it.
+    """
+    return QPalette(_build_dark_palette())
+
+
 def apply_dark_theme_to_table(table_widget):
-    """Apply dark theme styling to a QTableWidget."""
+    """Apply dark theme styling to a QTableView or QTableWidget."""
     # Set alternating row colors
     table_widget.setAlternatingRowColors(True)
     
-    # Set selection color
-    table_widget.setStyleSheet(f"""
-        QTableWidget::item:selected {{
-            background-color: {DarkThemeColors.TABLE_SELECTED_ROW};
-            color: {DarkThemeColors.TEXT_PRIMARY};
-        }}
-    """)
+    # Set selection color through the palette, which avoids re-polishing the
+    # table the way a per-table stylesheet would
+    palette = table_widget.palette()
+    palette.setColor(QPalette.Highlight, _QCOLORS[DarkThemeColors.TABLE_SELECTED_ROW])
+    palette.setColor(QPalette.HighlightedText, _QCOLORS[DarkThemeColors.TEXT_PRIMARY])
+    table_widget.setPalette(palette)
+
+
+# Shared change colors indexed by sign + 1, so painting a cell does not parse
+# and allocate a QColor
+_CHANGE_COLORS = (
+    _QCOLORS[DarkThemeColors.LOSS],
+    _QCOLORS[DarkThemeColors.NEUTRAL],
+    _QCOLORS[DarkThemeColors.PROFIT],
+)
 
 
 def get_color_for_change(change_pct):
-    """Get the appropriate color based on price change percentage."""
-    if change_pct > 0:
-        return QColor(DarkThemeColors.PROFIT)
-    elif change_pct < 0:
-        return QColor(DarkThemeColors.LOSS)
-    else:
-        return QColor(DarkThemeColors.NEUTRAL)
+    """Get the appropriate color based on price change percentage.
+    
+    The returned color is shared and must not be modified.
+    """
+    return _CHANGE_COLORS[(change_pct > 0) - (change_pct < 0) + 1]
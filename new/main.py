@@ -2,12 +2,9 @@
 Entry point for the crypto portfolio application.
 """
 import sys
-import os
 
-# Add the parent directory to path to enable imports
-sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
-
-# Import and run the application
+# Running this script puts its directory on sys.path, so the app package imports
+# directly; installed copies use the trendtracer console script instead
 from app.main import main
 
 if __name__ == "__main__":